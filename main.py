@@ -1,6 +1,7 @@
 import os
 import re
 import sys
+import multiprocessing
 from pathlib import Path
 from dotenv import load_dotenv
 from modules.getdbinfo import get_dbinfo_metadata, get_dbinfo_table, get_dbinfo_all_tables, get_dbinfo_tables_with_clob, get_dbinfo_list_of_tables
@@ -17,10 +18,11 @@ def load_grouped_vars_by_pattern():
     Returns:
         dict: A dictionary where the key is the NAME variable, and the value 
               is a dictionary containing the remaining variables 
-              (HOST, PORT, SERVICE_NAME, USER, PASSWORD, OWNER).
+              (HOST, PORT, SERVICE_NAME, USER, PASSWORD, OWNER and the optional 
+              MAX_WORKERS).
     """
     # Define the regex pattern to match the variables
-    pattern = re.compile(r'^(DES|PRE|PRO)_([A-Z]{2,3})_(V[6-8])_(NAME|HOST|PORT|SERVICE_NAME|USER|PASSWORD|OWNER)$')
+    pattern = re.compile(r'^(DES|PRE|PRO)_([A-Z]{2,3})_(V[6-8])_(NAME|HOST|PORT|SERVICE_NAME|USER|PASSWORD|OWNER|MAX_WORKERS)$')
     grouped_vars = {}
 
     for key, value in os.environ.items():
@@ -93,6 +95,18 @@ total_records_limit = int(os.getenv('TOTAL_RECORDS_LIMIT', 300000))
 # Get the separator for the csv files
 csv_separator = os.getenv('CSV_SEPARATOR', '|')
 
+# Get the number of processes used to prepare the sheets of the excel files
+excel_processes = int(os.getenv('EXCEL_PROCESSES', 1))
+
+# Get the number of threads used to prepare the sheets of the excel files (when not using processes)
+excel_threads = int(os.getenv('EXCEL_THREADS', 1))
+
+# Get how the clob fields are saved when dumping to excel: 'files' or 'zip'
+clob_mode = os.getenv('CLOB_MODE', 'files')
+
+# Get whether the tables that are empty according to the optimizer statistics are skipped when extracting all tables
+skip_empty_tables = os.getenv('SKIP_EMPTY_TABLES', 'false').strip().lower() == 'true'
+
 # Convert environment variable from string to list
 tables_with_clob_to_exclude = os.getenv('TABLES_WITH_CLOB_TO_EXCLUDE', '').split(',')
 tables_with_clob_to_exclude = [table.strip() for table in tables_with_clob_to_exclude]  # Remove any extra spaces
@@ -174,35 +188,35 @@ def main():
             db_info_catalog = get_dbinfo_metadata(connection_info)
             folder_name = f"{connection_info['service_name']}_catalog"
             if output_format == 'excel':
-                dump_dbinfo_to_excel(folder_name, db_info_catalog, output_dir_data)
+                dump_dbinfo_to_excel(folder_name, db_info_catalog, output_dir_data, processes=excel_processes, clob_mode=clob_mode, threads=excel_threads)
             else:
                 dump_dbinfo_to_csv(folder_name, db_info_catalog, output_dir_data, sep=csv_separator)
         elif option == 2:
             db_info_table = get_dbinfo_table(connection_info, table_name, sql_filter=sql_filter, sql_query=sql_query, max_records_per_table=max_records_per_table)
             folder_name = f"{connection_info['service_name']}_{table_name.lower()}"
             if output_format == 'excel':
-                dump_dbinfo_to_excel(folder_name, db_info_table, output_dir_data, include_record_count=True, max_records_per_table=max_records_per_table, file_name=table_name)
+                dump_dbinfo_to_excel(folder_name, db_info_table, output_dir_data, include_record_count=True, max_records_per_table=max_records_per_table, file_name=table_name, processes=excel_processes, clob_mode=clob_mode, threads=excel_threads)
             else:
                 dump_dbinfo_to_csv(folder_name, db_info_table, output_dir_data, sep=csv_separator, suffix=None)
         elif option == 3:
-            db_info_all_tables = get_dbinfo_all_tables(connection_info, tables_to_exclude, total_records_limit=total_records_limit, max_records_per_table=max_records_per_table)
+            db_info_all_tables = get_dbinfo_all_tables(connection_info, tables_to_exclude, total_records_limit=total_records_limit, max_records_per_table=max_records_per_table, skip_empty_tables=skip_empty_tables)
             folder_name = f"{connection_info['service_name']}_all_tables"
             if output_format == 'excel':
-                dump_dbinfo_to_excel(folder_name, db_info_all_tables, output_dir_data, include_record_count=True, max_records_per_table=max_records_per_table)
+                dump_dbinfo_to_excel(folder_name, db_info_all_tables, output_dir_data, include_record_count=True, max_records_per_table=max_records_per_table, processes=excel_processes, clob_mode=clob_mode, threads=excel_threads)
             else:
                 dump_dbinfo_to_csv(folder_name, db_info_all_tables, output_dir_data, sep=csv_separator) 
         elif option == 4:
             tables_with_clob = get_dbinfo_tables_with_clob(connection_info, tables_with_clob_to_exclude)
             folder_name = f"{connection_info['service_name']}_clobs"
             if output_format == 'excel':
-                dump_dbinfo_to_excel(folder_name, tables_with_clob, output_dir_data, include_record_count=True, max_records_per_table=max_records_per_table)
+                dump_dbinfo_to_excel(folder_name, tables_with_clob, output_dir_data, include_record_count=True, max_records_per_table=max_records_per_table, processes=excel_processes, clob_mode=clob_mode, threads=excel_threads)
             else:
                 dump_dbinfo_to_csv(folder_name, tables_with_clob, output_dir_data, sep=csv_separator)    
         elif option == 5:
             info_tables = get_dbinfo_list_of_tables(table_list, connection_info)
             folder_name = f"{connection_info['service_name']}_list_tables"
             if output_format == 'excel':
-                dump_dbinfo_to_excel(folder_name, info_tables, output_dir_data, include_record_count=True, max_records_per_table=max_records_per_table)
+                dump_dbinfo_to_excel(folder_name, info_tables, output_dir_data, include_record_count=True, max_records_per_table=max_records_per_table, processes=excel_processes, clob_mode=clob_mode, threads=excel_threads)
             else:
                 dump_dbinfo_to_csv(folder_name, info_tables, output_dir_data, sep=csv_separator) 
     elif option == 6:
@@ -218,5 +232,7 @@ def main():
 
 
 if __name__ == '__main__':
+    # Needed by the worker processes of the executable version
+    multiprocessing.freeze_support()
     main()
 
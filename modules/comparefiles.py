@@ -1,12 +1,17 @@
 import os
 import difflib
 import pandas as pd
+import xlsxwriter
 from openpyxl import Workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.cell.cell import Cell
 import re
 import shutil
 from datetime import datetime
-from modules.utils import adjust_column_widths, format_header_cell
+from modules.utils import add_header_format, adjust_column_widths_from_rows, compute_column_widths, format_header_cell
+
+
+# Table name at the start of the dumped file names (<table>__<column>_<index>.txt)
+_TABLE_NAME_RE = re.compile(r"(.+?)__")
 
 
 def compare_text_files(file1, file2, output_file):
@@ -159,6 +164,8 @@ def generate_excel_from_diffs(folder1, folder2, diff_folder):
         # Write the header in the Excel file
         header = ['table_name', 'file_name', 'diff_file', 'diff_lines', 'file_exists']
         ws.append(header)
+        # The appended rows are kept to compute the column widths from their values, instead of walking the sheet cells
+        rows = [header]
 
         # Format the header cells
         for col_num, column_title in enumerate(header, start=1):
@@ -166,33 +173,32 @@ def generate_excel_from_diffs(folder1, folder2, diff_folder):
             format_header_cell(cell)  # Format the header cell
         
         # Iterate through the DataFrame and extract the information
-        for index, row in diffs_df.iterrows():
-            file = row['file_name']
-            diff_file = row['diff_file']
-            diff_lines = row['diff_lines']
-            file_exists = row['file_exists']
-            
+        # itertuples yields plain tuples of the needed columns, instead of building a Series for each row
+        diff_rows = diffs_df[['file_name', 'diff_file', 'diff_lines', 'file_exists']].itertuples(index=False, name=None)
+        for row_idx, (file, diff_file, diff_lines, file_exists) in enumerate(diff_rows, start=2):  # start=2 due to header and 1-based indexing of openpyxl
             # Get the table name from the file name
             # table_name_match = re.search(r"diff_(.+?)__", diff_file)
-            table_name_match = re.match(r"(.+?)__", file)
+            table_name_match = _TABLE_NAME_RE.match(file)
             table_name = table_name_match.group(1) if table_name_match else "Unknown"
 
             # Get only the file name for display
             file_name = os.path.basename(diff_file)
 
-            # Write the row in the Excel file
-            ws.append([table_name, file, diff_file, diff_lines, file_exists])
-
-            # Set hyperlink in the 'diff_file' cell
-            diff_file_cell = ws.cell(row=index + 2, column=3, value=file_name)  # +2 due to header and 1-based indexing of openpyxl
+            # Create the 'diff_file' cell with its hyperlink before appending the row, instead of rewriting it afterwards
+            diff_file_cell = Cell(ws, row=row_idx, column=3, value=file_name)
             diff_file_cell.hyperlink = diff_file  # Set the hyperlink to the full file path
             diff_file_cell.style = "Hyperlink"  # Apply hyperlink style for display
 
+            # Write the row in the Excel file
+            row = [table_name, file, diff_file_cell, diff_lines, file_exists]
+            ws.append(row)
+            rows.append(row)
+
         # Freeze the first row (header)
         ws.freeze_panes = ws['A2']        
         
         # Auto-size columns 
-        adjust_column_widths(ws)
+        adjust_column_widths_from_rows(ws, rows)
 
         # Apply auto-filter to all columns
         ws.auto_filter.ref = ws.dimensions
@@ -202,6 +208,53 @@ def generate_excel_from_diffs(folder1, folder2, diff_folder):
         wb.save(excel_path)
 
 
+def write_differences_to_excel(differences_df, output_file):
+    """
+    Saves a DataFrame with differences to an Excel file with a single "Differences" sheet.
+
+    The sheet only holds tabular data, so it is written row by row with XlsxWriter in constant memory mode 
+    instead of building every cell with openpyxl and formatting them afterwards. The header is formatted, 
+    the first row is frozen, a filter is applied to all columns and the column widths are adjusted.
+
+    Args:
+        differences_df (pd.DataFrame): The DataFrame with the differences.
+        output_file (str): Path to the Excel file where the differences will be saved.
+
+    Returns:
+        None
+    """
+    header = list(differences_df.columns)
+
+    # NaN and NaT values are written as empty cells (a NaN is the only value not equal to itself)
+    rows = [[None if value is None or value != value else value for value in row]
+            for row in differences_df.itertuples(index=False, name=None)]
+
+    workbook = xlsxwriter.Workbook(output_file, {
+        'constant_memory': True,
+        'strings_to_urls': False,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+    })
+    ws = workbook.add_worksheet("Differences")
+
+    # Adjust column widths
+    for col_num, width in enumerate(compute_column_widths([header] + rows)):
+        ws.set_column(col_num, col_num, width)
+
+    # Freeze the first row (header)
+    ws.freeze_panes(1, 0)
+
+    # Format the header
+    ws.write_row(0, 0, header, add_header_format(workbook))
+
+    for row_num, row in enumerate(rows, start=1):
+        ws.write_row(row_num, 0, row)
+
+    # Apply a filter to all columns
+    ws.autofilter(0, 0, len(rows), len(header) - 1)
+
+    workbook.close()
+
+
 def compare_excel_dbinfo_files(file1, file2, output_file):
     """
     Compares two Excel files generated with get_dbinfo_metadata to find differences
@@ -243,49 +296,57 @@ def compare_excel_dbinfo_files(file1, file2, output_file):
         df1 = pd.read_excel(excel1, sheet_name=table_name)
         df2 = pd.read_excel(excel2, sheet_name=table_name)
         
+        # itertuples yields plain (column_name, data_type, data_length) tuples, instead of building a Series for each row
+        compared_columns = ['column_name', 'data_type', 'data_length']
+        rows1 = list(df1[compared_columns].itertuples(index=False, name=None))
+        rows2 = list(df2[compared_columns].itertuples(index=False, name=None))
+
+        # Index the columns of each table by name once, instead of filtering a copy of df2 for every column
+        columns1 = set(df1['column_name'].values)
+        columns2 = {}
+        for row2 in rows2:
+            columns2.setdefault(row2[0], row2)
+
         # Compare specific columns: column_name, data_type, data_length
-        for _, row1 in df1.iterrows():
-            column_name = row1['column_name']
-            row2 = df2[df2['column_name'] == column_name]
+        for column_name, data_type1, data_length1 in rows1:
+            row2 = columns2.get(column_name)
             
-            if row2.empty:
+            if row2 is None:
                 differences.append({
                     'table_name': table_name,
                     'column_name': column_name,
                     'difference': 'Column missing in second file',
-                    'resolution_sql': f"ALTER TABLE SGLOWNER.{table_name} ADD {column_name} {row1['data_type']}({row1['data_length']});"
+                    'resolution_sql': f"ALTER TABLE SGLOWNER.{table_name} ADD {column_name} {data_type1}({data_length1});"
                 })
                 continue
-            
-            row2 = row2.iloc[0]
+            _, data_type2, data_length2 = row2
             
             # Compare data_type
-            if row1['data_type'] != row2['data_type']:
+            if data_type1 != data_type2:
                 differences.append({
                     'table_name': table_name,
                     'column_name': column_name,
-                    'difference': f"data_type mismatch: {row1['data_type']} vs {row2['data_type']}",
-                    'resolution_sql': f"ALTER TABLE SGLOWNER.{table_name} MODIFY {column_name} {row1['data_type']}({row1['data_length']});"
+                    'difference': f"data_type mismatch: {data_type1} vs {data_type2}",
+                    'resolution_sql': f"ALTER TABLE SGLOWNER.{table_name} MODIFY {column_name} {data_type1}({data_length1});"
                 })
             
             # Compare data_length
-            if row1['data_length'] != row2['data_length']:
+            if data_length1 != data_length2:
                 differences.append({
                     'table_name': table_name,
                     'column_name': column_name,
-                    'difference': f"data_length mismatch: {row1['data_length']} vs {row2['data_length']}",
-                    'resolution_sql': f"ALTER TABLE SGLOWNER.{table_name} MODIFY {column_name} {row1['data_type']}({row1['data_length']});"
+                    'difference': f"data_length mismatch: {data_length1} vs {data_length2}",
+                    'resolution_sql': f"ALTER TABLE SGLOWNER.{table_name} MODIFY {column_name} {data_type1}({data_length1});"
                 })
 
         # Check columns in df2 that are not in df1
-        for _, row2 in df2.iterrows():
-            column_name = row2['column_name']
-            if column_name not in df1['column_name'].values:
+        for column_name, data_type2, data_length2 in rows2:
+            if column_name not in columns1:
                 differences.append({
                     'table_name': table_name,
                     'column_name': column_name,
                     'difference': 'Column missing in first file',
-                    'resolution_sql': f"ALTER TABLE SGLOWNER.{table_name} ADD {column_name} {row2['data_type']}({row2['data_length']});"
+                    'resolution_sql': f"ALTER TABLE SGLOWNER.{table_name} ADD {column_name} {data_type2}({data_length2});"
                 })
 
     # Add entries for tables present only in one file
@@ -309,23 +370,7 @@ def compare_excel_dbinfo_files(file1, file2, output_file):
     differences_df = pd.DataFrame(differences, columns=['table_name', 'column_name', 'difference', 'resolution_sql'])
     
     # Create an Excel file with the appropriate format
-    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-        differences_df.to_excel(writer, sheet_name="Differences", index=False)
-        wb = writer.book
-        ws = wb["Differences"]
-        
-        # Freeze the first row (header)
-        ws.freeze_panes = 'A2'  
-
-        # Format the header
-        for cell in ws[1]:
-            format_header_cell(cell)
-        
-        # Adjust column widths
-        adjust_column_widths(ws)
-
-        # Apply a filter to all columns
-        ws.auto_filter.ref = ws.dimensions
+    write_differences_to_excel(differences_df, output_file)
 
     return differences_df
 
@@ -432,8 +477,11 @@ def compare_file_info(df1, df2, output_folder):
     # List to store differences
     differences = []
 
-    # Identify differences in the merged DataFrame
-    for _, row in merged_df.iterrows():
+    # Identify differences in the merged DataFrame. itertuples yields plain tuples of the needed columns, instead of 
+    # building a Series for each row
+    merged_columns = ['file_name', '_merge', 'modification_date_df1', 'modification_date_df2', 'file_size_df1', 'file_size_df2']
+    for values in merged_df[merged_columns].itertuples(index=False, name=None):
+        row = dict(zip(merged_columns, values))
         file_name = row['file_name']
         
         if row['_merge'] == 'left_only':
@@ -485,23 +533,7 @@ def compare_file_info(df1, df2, output_folder):
 
     # Save the differences in an Excel file in the output folder
     output_file_path = os.path.join(output_folder, "file_differences.xlsx")
-    with pd.ExcelWriter(output_file_path, engine='openpyxl') as writer:
-        differences_df.to_excel(writer, sheet_name="Differences", index=False)
-        wb = writer.book
-        ws = wb["Differences"]
-
-        # Freeze first row (header)
-        ws.freeze_panes = 'A2'  
-
-        # Format the header
-        for cell in ws[1]:
-            format_header_cell(cell)
-        
-        # Adjust column widths
-        adjust_column_widths(ws)
-
-        # Apply a filter to all columns
-        ws.auto_filter.ref = ws.dimensions
+    write_differences_to_excel(differences_df, output_file_path)
 
     return differences_df
 
@@ -1,15 +1,53 @@
 import os
+import numpy as np
 import pandas as pd
+import xlsxwriter
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, colors
 from openpyxl.utils import get_column_letter
-from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.worksheet.hyperlink import Hyperlink
-from openpyxl.utils.exceptions import IllegalCharacterError
 from datetime import datetime, date
 import re
 import shutil
-from modules.utils import adjust_column_widths, format_header_cell
+import threading
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from modules.utils import add_header_format, adjust_column_widths_from_rows, compute_column_widths, format_header_cell
+
+
+# Flags used to create the CLOB text files. O_BINARY (Windows) avoids newline translation
+_CLOB_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Characters that are not valid in the CLOB text file names
+_CLOB_SANITIZE_RE = re.compile(r'[^\w_. -]')
+
+# Maximum number of threads writing CLOB text files at the same time, and number of files written by each task
+_CLOB_MAX_WORKERS = 8
+_CLOB_WRITE_BATCH = 64
+
+# Fonts of the hyperlink cells created by create_hyperlink, by font size
+_HYPERLINK_FONTS = {}
+
+# Control characters that cannot be written into an Excel sheet (all below 32 except tab, newline and carriage
+# return), mapped to None so str.translate deletes them in a single pass
+_ILLEGAL_CHARS_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20)])
+
+# Data types of the columns whose newlines are replaced by spaces in the CSV files
+_CSV_TEXT_TYPES = {'CLOB', 'LONG', 'VARCHAR', 'VARCHAR2'}
+
+# Size of the write buffer of the CSV files
+_CSV_BUFFER_SIZE = 1024 * 1024
+
+# Maximum number of threads writing CSV files at the same time
+_CSV_MAX_WORKERS = 8
+
+# Types of object columns (as inferred by pandas) whose values are all written to Excel as strings
+_STR_CONVERTED_TYPES = {'decimal', 'time'}
+
+# Number of data rows of each table sheet used to estimate its column widths
+_WIDTH_SAMPLE_ROWS = 100
 
 
 def dump_dbinfo_to_csv(folder_name:str, table_dataframes: dict, output_dir: str, sep: str=',', suffix: str = None):
@@ -49,55 +87,148 @@ def dump_dbinfo_to_csv(folder_name:str, table_dataframes: dict, output_dir: str,
     if not output_dir.endswith(folder_name):
         output_dir = os.path.join(output_dir, folder_name)
 
-    # Delete the output directory if it exists
+    # Delete the output directory if it exists and create it again
+    cleanup_thread = _reset_output_dir(output_dir)
+    print(f"Created output directory: {output_dir}")
+
+    # Errors are collected and printed once all the files are saved, instead of printing them one by one
+    errors = []
+
+    # The CSV files are written by a pool of threads, overlapping the writing of one file with the preparation 
+    # of the next ones. The text columns are still cleaned in this thread
+    futures = []
+    with ThreadPoolExecutor(max_workers=min(_CSV_MAX_WORKERS, os.cpu_count() or 1)) as executor:
+        # Iterate over each table name and its corresponding DataFrame in the dictionary
+        for item, item_data in table_dataframes.items():
+            table_name = item_data['name']
+            dataframe = item_data['data']
+            fields = item_data['fields']
+
+            # Replace newline characters with spaces in all text columns
+            # column names in dataframe are in lower case meanwhile in fields dictionary are in upper case
+            text_columns = [column_name for column_name, column_info in fields.items() if column_info['data_type'] in _CSV_TEXT_TYPES]
+            for column_name in text_columns:
+                if column_name.lower() not in dataframe.columns:
+                    errors.append(f"{table_name}-{column_name}-'{column_name.lower()}'")
+                    continue
+                # Most columns have no newlines, so they are left untouched instead of being rebuilt
+                if not _has_newlines(dataframe[column_name.lower()]):
+                    continue
+                # Two literal replacements are faster than the equivalent r'\r?\n' regex
+                dataframe[column_name.lower()] = dataframe[column_name.lower()].str.replace('\r\n', ' ', regex=False).str.replace('\n', ' ', regex=False)
+
+            # Create the CSV file path using the table name
+            if suffix is not None:
+                table_name = table_name + suffix
+
+            file_path = os.path.join(output_dir, f"{table_name}.csv")
+            futures.append(executor.submit(_write_csv_file, dataframe, file_path, sep))
+
+        # Wait for all the files to be written, raising any error found while writing them
+        for future in futures:
+            future.result()
+
+    if errors:
+        print('\n'.join(errors))
+
+    # Wait for the files of the previous run to be deleted
+    if cleanup_thread is not None:
+        cleanup_thread.join()
+
+
+def _reset_output_dir(output_dir: str):
+    """
+    Deletes the output directory if it exists and creates it again empty.
+
+    The existing directory, which may hold thousands of files from a previous run, is renamed and deleted by a 
+    background thread, so the new files can be written meanwhile. If it cannot be renamed, it is deleted right away.
+
+    Parameters:
+    -----------
+    output_dir : str
+        The output directory.
+
+    Returns:
+    --------
+    threading.Thread or None
+        The thread deleting the previous directory, which the caller should join before returning, or None if 
+        there was nothing to delete in the background.
+    """
+    cleanup_thread = None
     if os.path.exists(output_dir):
-        shutil.rmtree(output_dir)
+        old_output_dir = f"{output_dir}.delete-{os.getpid()}"
+        try:
+            os.rename(output_dir, old_output_dir)
+        except OSError:
+            shutil.rmtree(output_dir)
+        else:
+            cleanup_thread = threading.Thread(target=shutil.rmtree, args=(old_output_dir,), kwargs={'ignore_errors': True})
+            cleanup_thread.start()
 
     # Create the output directory if it does not exist
     os.makedirs(output_dir, exist_ok=True)
-    print(f"Created output directory: {output_dir}")
+    return cleanup_thread
 
-    # Iterate over each table name and its corresponding DataFrame in the dictionary
-    for item, item_data in table_dataframes.items():
-        table_name = item_data['name']
-        dataframe = item_data['data']
-        fields = item_data['fields']
-
-        # Replace newline characters with spaces in all text columns
-        # column names in dataframe are in lower case meanwhile in fields dictionary are in upper case
-        for column_name, column_info in fields.items():
-            if column_info['data_type'] in ['CLOB', 'LONG', 'VARCHAR', 'VARCHAR2']:
-                try:
-                    dataframe[column_name.lower()] = dataframe[column_name.lower()].str.replace(r'\r?\n', ' ', regex=True)
-                except KeyError as ex:
-                    print(f'{table_name}-{column_name}-{ex}')
-
-        # Create the CSV file path using the table name
-        if suffix is not None:
-            table_name = table_name + suffix
-
-        file_path = os.path.join(output_dir, f"{table_name}.csv")
-        
-        # Save the DataFrame to a CSV file with the specified delimiter and without the index
-        dataframe.to_csv(file_path, sep=sep, index=False)
 
+def _has_newlines(column):
+    """
+    Checks whether any of the string values of a DataFrame column contains a newline character.
+
+    The values are joined and searched in a single pass, which is much faster than running a string method 
+    over each of them.
+
+    Parameters:
+    -----------
+    column : pandas.Series
+        The column to check.
 
-def create_hyperlink(ws, at_cell, sheet_name, cell_ref='A1', display_name=None, font_size=11):
+    Returns:
+    --------
+    bool
+        True if any string value contains a newline character, False otherwise.
+    """
+    return '\n' in ''.join([value for value in column.tolist() if isinstance(value, str)])
+
+
+def _write_csv_file(dataframe, file_path: str, sep: str):
+    """
+    Saves a DataFrame to a CSV file with the specified delimiter and without the index.
+
+    The file is opened with a large buffer so pandas writes each chunk of rows with fewer system calls.
+
+    Parameters:
+    -----------
+    dataframe : pandas.DataFrame
+        The data to save.
+
+    file_path : str
+        The path of the CSV file.
+
+    sep : str
+        Field delimiter for the CSV file.
+
+    Returns:
+    --------
+    None
     """
-    Creates a hyperlink in a specified cell that links to another cell within the same workbook.
+    with open(file_path, 'w', encoding='utf-8', newline='', buffering=_CSV_BUFFER_SIZE) as csv_file:
+        dataframe.to_csv(csv_file, sep=sep, index=False)
 
-    This function adds a hyperlink to a specified cell in an Excel worksheet (`ws`). The hyperlink points 
-    to a cell within another sheet (or the same sheet) within the same workbook. The cell containing the 
-    hyperlink is formatted with a blue, underlined font to resemble a standard hyperlink.
+
+def create_hyperlink(ws, sheet_name, cell_ref='A1', display_name=None, font_size=11):
+    """
+    Creates a cell with a hyperlink that links to another cell within the same workbook.
+
+    This function builds a write-only cell for the worksheet (`ws`) containing a hyperlink that points 
+    to a cell within another sheet (or the same sheet) within the same workbook. The cell is formatted 
+    with a blue, underlined font to resemble a standard hyperlink. Write-only sheets do not allow 
+    addressing their cells, so the returned cell has to be included in the row appended to the sheet.
 
     Parameters:
     -----------
-    ws : openpyxl.worksheet.worksheet.Worksheet
+    ws : openpyxl.worksheet._write_only.WriteOnlyWorksheet
         The worksheet where the hyperlink will be created.
     
-    at_cell : str
-        The cell reference (e.g., 'B2') where the hyperlink will be placed in the `ws` worksheet.
-    
     sheet_name : str
         The name of the sheet to which the hyperlink will point.
     
@@ -112,14 +243,20 @@ def create_hyperlink(ws, at_cell, sheet_name, cell_ref='A1', display_name=None,
 
     Returns:
     --------
-    None
+    openpyxl.cell.cell.Cell
+        The write-only cell containing the hyperlink.
     """
     if display_name is None:
         display_name = sheet_name
     to_location = "'{0}'!{1}".format(sheet_name, cell_ref)
-    ws[at_cell].hyperlink = Hyperlink(display=display_name, ref=at_cell, location=to_location)
-    ws[at_cell].value = display_name
-    ws[at_cell].font = Font(u='single', color=colors.BLUE, size=font_size)
+    cell = WriteOnlyCell(ws, value=display_name)
+    cell.hyperlink = Hyperlink(display=display_name, ref=cell.coordinate, location=to_location)
+    # The font of each size is created once and shared by all the hyperlink cells using it
+    font = _HYPERLINK_FONTS.get(font_size)
+    if font is None:
+        font = _HYPERLINK_FONTS[font_size] = Font(u='single', color=colors.BLUE, size=font_size)
+    cell.font = font
+    return cell
 
 
 def clean_value(value):
@@ -132,13 +269,86 @@ def clean_value(value):
         return ""
 
     if isinstance(value, str):
-        # Reemplaza caracteres de control no válidos (valores ASCII < 32) excepto '\n' y '\t'
-        value = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]', '', value)
+        # Elimina caracteres de control no válidos (valores ASCII < 32) excepto '\n', '\r' y '\t'
+        value = value.translate(_ILLEGAL_CHARS_TABLE)
     
     return value
 
 
-def dump_dbinfo_to_excel(folder_name:str, table_dataframes: dict, output_dir: str, include_record_count: bool = False, max_records_per_table: int = 50000, file_name: str = None):
+def _process_clob_data(table_name, column_name, value, index_values, clob_prefix):
+    """
+    Prepares the text file for a CLOB or LONG value.
+
+    The text file is named after the table, the column and the values of the index columns of the row. The file 
+    itself is not written here: its path and encoded content are returned so all the files of a sheet can be written 
+    together with `_write_clob_files` once the sheet has been populated.
+
+    Parameters:
+    -----------
+    table_name : str
+        The name of the table the value belongs to.
+
+    column_name : str
+        The name of the CLOB or LONG column.
+
+    value : str
+        The content of the CLOB or LONG value.
+
+    index_values : list
+        The values of the index columns of the row, used to make the file name unique.
+
+    clob_prefix : str
+        The directory where the text file will be saved, ending with a path separator.
+
+    Returns:
+    --------
+    tuple
+        The name of the text file, to be written in the cell, and a (file path, content) tuple with the 
+        pending write of the text file.
+    """
+    # Construir la parte final del nombre del archivo usando los valores de las columnas en index_list
+    index_part = "_".join(index_values)
+
+    # Define the filename for the CLOB content
+    clob_filename = f"{table_name}__{column_name}_{index_part}.txt"
+    # sustituimos los caracteres no válidos por _
+    clob_filename = _CLOB_SANITIZE_RE.sub('_', clob_filename)
+    clob_filepath = clob_prefix + clob_filename
+
+    # Encode the CLOB content once, it will be written as is. CLOB values are read as strings, so they are only 
+    # converted when they are not
+    data = (value if type(value) is str else str(value)).encode('utf-8', errors='replace')
+
+    return clob_filename, (clob_filepath, data)
+
+
+def _write_clob_files(clob_files):
+    """
+    Writes the CLOB text files collected while populating a sheet.
+
+    Each file is written with a single unbuffered write on a raw file descriptor, bypassing the buffered text layer.
+
+    Parameters:
+    -----------
+    clob_files : list
+        A list of (file path, content) tuples, where the content is already encoded as bytes.
+
+    Returns:
+    --------
+    None
+    """
+    for clob_filepath, data in clob_files:
+        # os.write may write less than requested on very large contents, so loop until everything is written
+        data = memoryview(data)
+        fd = os.open(clob_filepath, _CLOB_OPEN_FLAGS, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+
+def dump_dbinfo_to_excel(folder_name:str, table_dataframes: dict, output_dir: str, include_record_count: bool = False, max_records_per_table: int = 50000, file_name: str = None, backend: str = 'openpyxl', processes: int = None, clob_mode: str = 'files', threads: int = None):
     """
     Exports data from the provided dictionary to an Excel workbook, with each table's data in a separate sheet.
 
@@ -177,6 +387,27 @@ def dump_dbinfo_to_excel(folder_name:str, table_dataframes: dict, output_dir: st
         The name of the Excel file to be generated. If not provided, the file will be named using `folder_name`. 
         Default is None.
 
+    backend : str, optional
+        The library used to write the Excel file: 'openpyxl', which uses a write-only workbook, or 'xlsxwriter', 
+        which writes each row in constant memory and is the fastest option. XlsxWriter rewrites the '/' of the CLOB 
+        file links as '\\', so they only open on Windows, and it rejects the sheet names that openpyxl accepts with 
+        a warning (longer than 31 characters or equal ignoring case). Default is 'openpyxl'.
+
+    processes : int, optional
+        The number of worker processes used to prepare the table sheets (converting their values and writing their 
+        CLOB text files) while the workbook is written. If None or 1, the sheets are prepared sequentially. Default is None.
+
+    clob_mode : str, optional
+        How the CLOB text files are saved: 'files', which writes each one in a 'CLOB' subdirectory and links the 
+        cells to them, or 'zip', which stores all of them in a single compressed 'CLOB.zip' archive. Excel hyperlinks 
+        can't open a file inside an archive, so in 'zip' mode the cells have the name of the archive member as plain 
+        text, without a hyperlink. Default is 'files'.
+
+    threads : int, optional
+        The number of threads used to prepare the table sheets while the workbook is written, when `processes` is 
+        not used. Threads avoid sending the tables to other processes and mostly help when writing many CLOB text 
+        files. If None or 1, the sheets are prepared sequentially. Default is None.
+
     Returns:
     --------
     None
@@ -198,61 +429,430 @@ def dump_dbinfo_to_excel(folder_name:str, table_dataframes: dict, output_dir: st
     if not output_dir.endswith(folder_name):
         output_dir = os.path.join(output_dir, folder_name)
 
-    # Delete the output directory if it exists
-    if os.path.exists(output_dir):
-        shutil.rmtree(output_dir)
-
-    # Create the output directory if it does not exist
-    os.makedirs(output_dir, exist_ok=True)
+    # Delete the output directory if it exists and create it again
+    cleanup_thread = _reset_output_dir(output_dir)
     print(f"Created output directory: {output_dir}")
 
-    # Define the path for the CLOB subdirectory
-    clob_subdir = os.path.join(output_dir, 'CLOB')
-    # Ensure the CLOB subdirectory exists
-    os.makedirs(clob_subdir, exist_ok=True)
+    # Save the workbook to the output directory 
+    if file_name is None:
+        excel_file_path = os.path.join(output_dir, f"{folder_name}.xlsx")
+    else:
+        excel_file_path = os.path.join(output_dir, f"{file_name}.xlsx")
+
+    if backend == 'xlsxwriter':
+        dump_sheets = _dump_sheets_with_xlsxwriter
+    elif backend == 'openpyxl':
+        dump_sheets = _dump_sheets_with_openpyxl
+    else:
+        print(f"Invalid Excel backend: {backend}")
+        return
+
+    if clob_mode == 'files':
+        # Define the path for the CLOB subdirectory
+        clob_subdir = os.path.join(output_dir, 'CLOB')
+        # Ensure the CLOB subdirectory exists
+        os.makedirs(clob_subdir, exist_ok=True)
+        # The CLOB file paths are built by concatenating the file names to this prefix, instead of joining them each time
+        clob_prefix = os.path.join(clob_subdir, '')
+        prepared_sheets = _iter_prepared_sheets(table_dataframes, clob_prefix, max_records_per_table, processes, threads=threads)
+        dump_sheets(excel_file_path, table_dataframes, prepared_sheets, include_record_count)
+    elif clob_mode == 'zip':
+        # All the CLOB text files are stored in a single archive, avoiding the creation of thousands of small files
+        clob_archive_path = os.path.join(output_dir, 'CLOB.zip')
+        clob_prefix = f"{clob_archive_path}#"
+        with zipfile.ZipFile(clob_archive_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=3) as clob_archive:
+            prepared_sheets = _iter_prepared_sheets(table_dataframes, clob_prefix, max_records_per_table, processes, clob_archive=clob_archive, threads=threads)
+            dump_sheets(excel_file_path, table_dataframes, prepared_sheets, include_record_count)
+    else:
+        print(f"Invalid CLOB mode: {clob_mode}")
 
-    # Create the Excel workbook
-    workbook = Workbook()
+    # Wait for the files of the previous run to be deleted
+    if cleanup_thread is not None:
+        cleanup_thread.join()
+
+
+def _to_excel_value(value):
+    """
+    Converts a single value to a type that can be written to Excel.
+
+    Parameters:
+    -----------
+    value : any
+        The value to convert.
+
+    Returns:
+    --------
+    any
+        An empty string for None, NaN and NaT, a datetime for timestamps, the value itself for numbers, and a 
+        string without illegal characters for any other value.
+    """
+    # NaN and NaT values are written as empty cells (a NaN is the only value not equal to itself)
+    if value is None or value != value:
+        return ''
+    # Convert datetime64 and date values to Excel date format
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, date):
+        return value.date()
+    # Ensure the value is converted to a string if it's not a basic data type
+    if isinstance(value, (int, float)):
+        return value
+    # clean_value removes the characters that Excel rejects as illegal
+    return clean_value(str(value))
+
+
+def _column_to_excel_values(column):
+    """
+    Converts a DataFrame column to a list of values that can be written to Excel, as `_to_excel_value` does for 
+    each value.
+
+    Datetime, numeric and string columns are converted in bulk, so only the values of mixed object columns are 
+    checked one by one.
+
+    Parameters:
+    -----------
+    column : pandas.Series
+        The column to convert.
+
+    Returns:
+    --------
+    list
+        The converted values of the column.
+    """
+    if pd.api.types.is_datetime64_any_dtype(column.dtype):
+        return ['' if value is pd.NaT else value for value in column.dt.to_pydatetime()]
+    if pd.api.types.is_integer_dtype(column.dtype) or pd.api.types.is_bool_dtype(column.dtype):
+        return column.tolist()
+    if pd.api.types.is_float_dtype(column.dtype):
+        return ['' if value != value else value for value in column.tolist()]
+    if pd.api.types.infer_dtype(column, skipna=True) == 'string':
+        # Columns holding only strings are checked for illegal characters in a single pass over all their values, 
+        # as most of them have none and can be written as they are
+        values = column.fillna('').tolist()
+        joined_values = ''.join(values)
+        if len(joined_values.translate(_ILLEGAL_CHARS_TABLE)) == len(joined_values):
+            return values
+        return [value.translate(_ILLEGAL_CHARS_TABLE) for value in values]
+    if pd.api.types.infer_dtype(column, skipna=True) in _STR_CONVERTED_TYPES:
+        # Values that are always written as strings are converted in bulk (their text has no illegal characters)
+        return column.astype(str).where(column.notna(), '').tolist()
+    return [_to_excel_value(value) for value in column.tolist()]
+
+
+def _limit_records(dataframe, max_records: int):
+    """
+    Limits a DataFrame to its first `max_records` rows.
+
+    Most tables have fewer records than the limit, so the DataFrame itself is returned for them instead of a new 
+    slice of it.
+
+    Parameters:
+    -----------
+    dataframe : pandas.DataFrame
+        The data of the table.
+
+    max_records : int
+        The maximum number of records to keep.
+
+    Returns:
+    --------
+    pandas.DataFrame
+        The DataFrame, or a positional slice of its first `max_records` rows.
+    """
+    if len(dataframe) <= max_records:
+        return dataframe
+    return dataframe.iloc[:max_records]
+
+
+def _prepare_sheet_rows(item_data: dict, clob_prefix: str, max_records_per_table: int):
+    """
+    Converts the data of a table into the rows to be written in its Excel sheet.
+
+    The values are converted to types that can be written to Excel: timestamps become datetimes, NaN and NaT become 
+    empty cells, other non-basic values become strings and illegal characters are removed. CLOB and LONG values are 
+    replaced by the name of the text file holding their content.
+
+    Parameters:
+    -----------
+    item_data : dict
+        A dictionary with the 'name', 'data', 'fields' and 'index' of the table, as described in `dump_dbinfo_to_excel`.
+
+    clob_prefix : str
+        The directory where the CLOB text files will be saved, ending with a path separator.
+
+    max_records_per_table : int
+        The maximum number of records to include in the sheet.
+
+    Returns:
+    --------
+    tuple
+        - header : list with the column names of the sheet.
+        - data_rows : list with the values of each row.
+        - clob_links : dict mapping the position of each row in `data_rows` to a list of (column position, file path) 
+          tuples, for the cells that must link to a CLOB text file.
+        - clob_files : list of (file path, content) tuples with the CLOB text files to be written.
+    """
+    table_name = item_data['name']
+    dataframe = item_data['data']
+    fields = item_data['fields']
+    column_names = list(fields.keys())
+    data_types = [value['data_type'] for value in fields.values()]
+    index_list = item_data['index']
+
+    # Positions of the CLOB columns and of the index columns, computed once per table instead of per cell
+    clob_col_positions = {i for i, data_type in enumerate(data_types) if data_type in ('LONG', 'CLOB')}
+    column_positions = {column_name: i for i, column_name in enumerate(column_names)}
+    index_positions = [column_positions[index_col] for index_col in (index_list or []) if index_col in column_positions]
+
+    # Limit the number of records to max_records_per_table
+    limited_dataframe = _limit_records(dataframe, max_records_per_table)
+
+    header = list(limited_dataframe.columns)
+    # The values are converted column by column, dispatching on the dtype of each column once instead of checking 
+    # the type of every cell. CLOB columns are filled below, as they depend on the index values
+    columns = [limited_dataframe.iloc[:, c_idx] for c_idx in range(len(header))]
+    converted_columns = [
+        [''] * len(limited_dataframe) if c_idx in clob_col_positions else _column_to_excel_values(column)
+        for c_idx, column in enumerate(columns)
+    ]
+
+    clob_links = {}
+    # CLOB text files are collected while the rows are processed and written once the sheet is populated
+    clob_files = []
+    if clob_col_positions:
+        # The index values are taken from the original columns, before any conversion. They only name the CLOB 
+        # files, so they are built once per row and only when needed
+        index_columns = [columns[p].tolist() for p in index_positions]
+        row_index_values = {}
+        for c_idx in sorted(p for p in clob_col_positions if p < len(columns)):
+            clob_values = columns[c_idx].tolist()
+            clob_cells = converted_columns[c_idx]
+            # Only the rows with a CLOB value are visited, a NaN CLOB value is left empty
+            for r_idx in np.flatnonzero(columns[c_idx].notna().to_numpy()).tolist():
+                index_values = row_index_values.get(r_idx)
+                if index_values is None:
+                    index_values = row_index_values[r_idx] = [str(index_column[r_idx]) for index_column in index_columns]
+                # Handle CLOB data by writing it to a text file
+                clob_filename, clob_file = _process_clob_data(table_name, column_names[c_idx], clob_values[r_idx], index_values, clob_prefix)
+                clob_files.append(clob_file)
+                clob_links.setdefault(r_idx, []).append((c_idx, clob_file[0]))
+                # The file name is already sanitized, so it has no illegal characters to clean
+                clob_cells[r_idx] = clob_filename
+
+    data_rows = [list(row) for row in zip(*converted_columns)]
+
+    return header, data_rows, clob_links, clob_files
+
+
+def _prepare_sheet(item_data: dict, clob_prefix: str, max_records_per_table: int, write_clob_files: bool = True):
+    """
+    Prepares the rows of a table sheet and writes its CLOB text files.
+
+    It is a module level function so it can be run in a worker process by `_iter_prepared_sheets`.
+
+    Parameters:
+    -----------
+    item_data : dict
+        A dictionary with the 'name', 'data', 'fields' and 'index' of the table, as described in `dump_dbinfo_to_excel`.
+
+    clob_prefix : str
+        The directory where the CLOB text files will be saved, ending with a path separator.
+
+    max_records_per_table : int
+        The maximum number of records to include in the sheet.
+
+    write_clob_files : bool, optional
+        If True, the CLOB text files are written and an empty list of files is returned. If False, they are returned 
+        so the caller can store them. Default is True.
+
+    Returns:
+    --------
+    tuple
+        The header, data_rows, clob_links and clob_files returned by `_prepare_sheet_rows`.
+    """
+    header, data_rows, clob_links, clob_files = _prepare_sheet_rows(item_data, clob_prefix, max_records_per_table)
+    if write_clob_files:
+        _write_clob_files(clob_files)
+        clob_files = []
+    return header, data_rows, clob_links, clob_files
+
+
+def _iter_prepared_sheets(table_dataframes: dict, clob_prefix: str, max_records_per_table: int, processes: int = None, clob_archive: zipfile.ZipFile = None, threads: int = None):
+    """
+    Yields the prepared rows of each table sheet, in the order of `table_dataframes`.
+
+    With several processes or threads, the sheets are prepared in a pool while the caller writes the previous ones 
+    to the workbook. The workbook itself is still written by a single thread, and only a few sheets are prepared 
+    ahead of the one being written so their rows do not pile up in memory.
+
+    Parameters:
+    -----------
+    table_dataframes : dict
+        The tables to export, as described in `dump_dbinfo_to_excel`.
+
+    clob_prefix : str
+        The directory where the CLOB text files will be saved, ending with a path separator, or the archive path 
+        followed by '#' when `clob_archive` is given.
+
+    max_records_per_table : int
+        The maximum number of records to include per table in the Excel sheet.
+
+    processes : int, optional
+        The number of worker processes. If None or 1, the sheets are prepared sequentially. Default is None.
+
+    clob_archive : zipfile.ZipFile, optional
+        If given, the CLOB text files are stored in this archive, named after their path without `clob_prefix`, 
+        instead of being written to disk, and no CLOB links are yielded. Default is None.
+
+    threads : int, optional
+        The number of worker threads, used when `processes` is None or 1. If None or 1, the sheets are prepared 
+        sequentially. Default is None.
+
+    Yields:
+    -------
+    tuple
+        The header, data_rows and clob_links of each table sheet.
+    """
+    write_clob_files = clob_archive is None
+    for header, data_rows, clob_links, clob_files in _iter_sheet_results(table_dataframes, clob_prefix, max_records_per_table, processes, threads, write_clob_files):
+        if clob_archive is not None:
+            # The archive is only written from this process, so the workers return the CLOB files instead of writing them
+            for clob_filepath, data in clob_files:
+                clob_archive.writestr(clob_filepath[len(clob_prefix):], data)
+            # Excel can't open a file inside an archive from a hyperlink, so the cells keep the member name as plain text
+            clob_links = {}
+        yield header, data_rows, clob_links
+
+
+def _iter_sheet_results(table_dataframes: dict, clob_prefix: str, max_records_per_table: int, processes: int, threads: int, write_clob_files: bool):
+    """
+    Yields the result of `_prepare_sheet` for each table, in the order of `table_dataframes`, using a process pool 
+    when several processes are requested, or else a thread pool when several threads are requested.
+
+    When the sheets are prepared sequentially, their CLOB text files are written by a pool of threads, so the 
+    disk writes overlap with the writing of the sheets to the workbook.
+
+    The parameters are described in `_iter_prepared_sheets` and `_prepare_sheet`.
+    """
+    if processes and processes > 1:
+        executor, workers = ProcessPoolExecutor(max_workers=processes), processes
+    elif threads and threads > 1:
+        executor, workers = ThreadPoolExecutor(max_workers=threads), threads
+    else:
+        futures = []
+        with ThreadPoolExecutor(max_workers=_CLOB_MAX_WORKERS) as clob_executor:
+            for item_data in table_dataframes.values():
+                header, data_rows, clob_links, clob_files = _prepare_sheet(item_data, clob_prefix, max_records_per_table, write_clob_files=False)
+                if write_clob_files:
+                    # The files are submitted in small batches, to spread them among the threads
+                    for start in range(0, len(clob_files), _CLOB_WRITE_BATCH):
+                        futures.append(clob_executor.submit(_write_clob_files, clob_files[start:start + _CLOB_WRITE_BATCH]))
+                    clob_files = []
+                yield header, data_rows, clob_links, clob_files
+
+            # Wait for all the files to be written, raising any error found while writing them
+            for future in futures:
+                future.result()
+        return
+
+    with executor:
+        pending = deque()
+        for item_data in table_dataframes.values():
+            # Only the records written to the sheet are sent to the worker
+            worker_data = dict(item_data, data=_limit_records(item_data['data'], max_records_per_table))
+            pending.append(executor.submit(_prepare_sheet, worker_data, clob_prefix, max_records_per_table, write_clob_files))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _finish_prepared_sheets(prepared_sheets):
+    """
+    Exhausts the generator returned by `_iter_prepared_sheets` once all the sheets have been taken from it.
+
+    Iterating the sheets together with `table_dataframes` stops at the last sheet without resuming the generator, 
+    so the code that runs after its last sheet (waiting for the CLOB text files to be written and raising their 
+    errors) would never run.
+
+    Parameters:
+    -----------
+    prepared_sheets : generator
+        The generator of prepared sheets, with all its sheets already consumed.
+
+    Returns:
+    --------
+    None
+    """
+    for _ in prepared_sheets:
+        pass
+
+
+def _dump_sheets_with_openpyxl(excel_file_path: str, table_dataframes: dict, prepared_sheets, include_record_count: bool):
+    """
+    Writes the index sheet and the table sheets of `dump_dbinfo_to_excel` with an openpyxl write-only workbook.
+
+    Parameters:
+    -----------
+    excel_file_path : str
+        The path of the Excel file to be generated.
+
+    table_dataframes : dict
+        The tables to export, as described in `dump_dbinfo_to_excel`.
+
+    prepared_sheets : iterable
+        The header, data_rows and clob_links of each table sheet, in the order of `table_dataframes`, as yielded 
+        by `_iter_prepared_sheets`.
+
+    include_record_count : bool
+        If True, adds a column to the index sheet that shows the number of records in each table.
+
+    Returns:
+    --------
+    None
+    """
+    # Create the Excel workbook in write-only mode, so the rows are written to disk as they are appended
+    # instead of keeping every cell in memory
+    workbook = Workbook(write_only=True)
 
     # Default Excel font size if not specified
     standard_font_size = 11  
 
-    # Use the default sheet as the index sheet
-    index_sheet = workbook.active
-    index_sheet.title = "Tables"
+    # Write-only workbooks have no default sheet, so the index sheet is created explicitly
+    index_sheet = workbook.create_sheet("Tables")
     
     # Add headers to the index sheet
-    index_sheet.cell(row=1, column=1, value="Table")
-    format_header_cell(index_sheet.cell(row=1, column=1), font_size=standard_font_size)
+    index_header = ["Table"]
     if include_record_count:
-        index_sheet.cell(row=1, column=2, value="Record Count")
-        format_header_cell(index_sheet.cell(row=1, column=2), font_size=standard_font_size)
-
-    # Populate the index sheet with table names (and record counts if enabled)
-    for i, (item, item_data) in enumerate(table_dataframes.items(), start=2):
+        index_header.append("Record Count")
+    index_header_row = []
+    for header in index_header:
+        cell = WriteOnlyCell(index_sheet, value=header)
+        format_header_cell(cell, font_size=standard_font_size)
+        index_header_row.append(cell)
+    index_rows = [index_header_row]
+
+    # Populate the index sheet with links to each table sheet (and record counts if enabled)
+    for item, item_data in table_dataframes.items():
         table_name = item_data['name']
         dataframe = item_data['data']
-        index_sheet.cell(row=i, column=1, value=table_name)
+        index_row = [create_hyperlink(index_sheet, table_name, cell_ref='A1', font_size=standard_font_size)]
         if include_record_count:
-            index_sheet.cell(row=i, column=2, value=len(dataframe))
+            index_row.append(len(dataframe))
+        index_rows.append(index_row)
     
-    # Adjust column width for the index sheet
-    adjust_column_widths(index_sheet)
+    # Adjust column width for the index sheet (it must be done before appending the rows)
+    adjust_column_widths_from_rows(index_sheet, index_rows)
+
+    for index_row in index_rows:
+        index_sheet.append(index_row)
 
     # Apply a filter to all columns
-    index_sheet.auto_filter.ref = index_sheet.dimensions
+    index_sheet.auto_filter.ref = f"A1:{get_column_letter(len(index_header))}{len(index_rows)}"
 
-    for item, item_data in table_dataframes.items():
+    # The rows of each table are buffered, as the column widths of a write-only sheet must be set before appending them
+    for item_data, (header, data_rows, clob_links) in zip(table_dataframes.values(), prepared_sheets):
         table_name = item_data['name']
-        dataframe = item_data['data']
-        fields = item_data['fields']
-        # print(f'fields: {fields}')
-        column_names = list(fields.keys())
-        data_types = [value['data_type'] for value in fields.values()]
-        index_list = item_data['index']
-
-        # Limit the number of records to max_records_per_table
-        limited_dataframe = dataframe.head(max_records_per_table)
 
         # Create a new sheet with the table name
         sheet = workbook.create_sheet(title=table_name)
@@ -260,83 +860,146 @@ def dump_dbinfo_to_excel(folder_name:str, table_dataframes: dict, output_dir: st
         # Freeze first row (header)
         sheet.freeze_panes = 'A2'  
 
-        # Add the DataFrame to the sheet
-        for r_idx, row in enumerate(dataframe_to_rows(limited_dataframe, index=False, header=True), 1):
-            for c_idx, value in enumerate(row, 1):
-                # Apply formatting to header row
-                if r_idx == 1:  
-                    cell = sheet.cell(row=r_idx, column=c_idx, value=value)
-                    format_header_cell(cell, font_size=standard_font_size)
-                else:
-                    if data_types[c_idx-1] == 'LONG' or data_types[c_idx-1] == 'CLOB':
-                        # Handle CLOB data by writing it to a text file
-                        if pd.notna(value):
-                            if index_list is None:
-                                print(table_name)
-
-                            # Construir la parte final del nombre del archivo usando los valores de las columnas en index_list
-                            index_values = [str(sheet.cell(row=r_idx, column=column_names.index(index_col)+1).value) for index_col in index_list]
-                            index_part = "_".join(index_values)
-
-                            # Define the filename for the CLOB content
-                            clob_filename = f"{table_name}__{column_names[c_idx-1]}_{index_part}.txt"
-                            # sustituimos los caracteres no válidos por _
-                            clob_filename = re.sub(r'[^\w_. -]', '_', clob_filename)
-                            clob_filepath = os.path.join(clob_subdir, clob_filename)
-                            
-                            # Write CLOB content to a text file
-                            with open(clob_filepath, 'w') as file:
-                                file.write(str(value))
-                            
-                            # Set the cell value to the filename
-                            cell_value = clob_filename
-
-                            # Create a hyperlink in the Excel cell to the CLOB text file
-                            cell = sheet.cell(row=r_idx, column=c_idx, value=clob_filename)
-                            cell.hyperlink = clob_filepath
-                            cell.style = "Hyperlink"
-
-                        else:
-                            # In case of a NaN CLOB value
-                            cell_value = ''
-                    # Convert datetime64 and date values to Excel date format
-                    elif isinstance(value, pd.Timestamp):
-                        cell_value = value.to_pydatetime()
-                    elif isinstance(value, date):
-                        cell_value = value.date()  
-                    else:
-                        # Ensure the value is converted to a string if it's not a basic data type
-                        cell_value = str(value) if not isinstance(value, (int, float, type(None))) else value
-                    try:
-                        cell_value = clean_value(cell_value)
-                        cell = sheet.cell(row=r_idx, column=c_idx, value=cell_value)
-                    except IllegalCharacterError as ex:
-                        print(f'table with illegal character: {table_name}')
-
-        
-        # Auto-size columns 
-        adjust_column_widths(sheet)
+        header_row = []
+        for value in header:
+            cell = WriteOnlyCell(sheet, value=value)
+            format_header_cell(cell, font_size=standard_font_size)
+            header_row.append(cell)
 
-        # Apply a filter to all columns
-        sheet.auto_filter.ref = sheet.dimensions
+        # Auto-size columns from a sample of the rows, instead of going through the whole table again
+        adjust_column_widths_from_rows(sheet, [header_row] + data_rows[:_WIDTH_SAMPLE_ROWS])
 
         # Add a hyperlink to return to the "Tables" sheet in the last cell of the header row
-        last_col_idx = len(dataframe.columns) + 1
-        return_cell = sheet.cell(row=1, column=last_col_idx)
-        create_hyperlink(sheet, at_cell=return_cell.coordinate, sheet_name="Tables", cell_ref='A1', display_name="Return to Tables", font_size=standard_font_size+1)
+        last_col_idx = len(header) + 1
+        header_row.append(create_hyperlink(sheet, sheet_name="Tables", cell_ref='A1', display_name="Return to Tables", font_size=standard_font_size+1))
 
         # Adjust the column width to fit the "Return to Tables" message.
-        sheet.column_dimensions[return_cell.column_letter].width = len("Return to Tables") + 2
+        sheet.column_dimensions[get_column_letter(last_col_idx)].width = len("Return to Tables") + 2
+
+        sheet.append(header_row)
+        for r_idx, row_values in enumerate(data_rows):
+            # Create a hyperlink in the Excel cells to their CLOB text files
+            for c_idx, clob_filepath in clob_links.get(r_idx, ()):
+                cell = WriteOnlyCell(sheet, value=row_values[c_idx])
+                cell.hyperlink = clob_filepath
+                cell.style = "Hyperlink"
+                row_values[c_idx] = cell
+            sheet.append(row_values)
 
+        # Apply a filter to all columns
+        sheet.auto_filter.ref = f"A1:{get_column_letter(max(last_col_idx - 1, 1))}{len(data_rows) + 1}"
 
-    # Links are created for each table in the list for easy access to its sheet.
-    for i in range(2, index_sheet.max_row + 1):
-        create_hyperlink(index_sheet, 'A' + str(i), index_sheet['A' + str(i)].value, cell_ref='A1')
+    # Wait for the CLOB text files to be written, raising any error found while writing them, before saving the workbook
+    _finish_prepared_sheets(prepared_sheets)
+    workbook.save(excel_file_path)
 
-    # Save the workbook to the output directory 
-    if file_name is None:
-        excel_file_path = os.path.join(output_dir, f"{folder_name}.xlsx")
-    else:
-        excel_file_path = os.path.join(output_dir, f"{file_name}.xlsx")
 
-    workbook.save(excel_file_path)
+def _dump_sheets_with_xlsxwriter(excel_file_path: str, table_dataframes: dict, prepared_sheets, include_record_count: bool):
+    """
+    Writes the index sheet and the table sheets of `dump_dbinfo_to_excel` with XlsxWriter in constant memory mode.
+
+    In constant memory mode every row is flushed to disk as soon as the next one is written, so the rows of each 
+    sheet are written strictly in order.
+
+    Parameters:
+    -----------
+    excel_file_path : str
+        The path of the Excel file to be generated.
+
+    table_dataframes : dict
+        The tables to export, as described in `dump_dbinfo_to_excel`.
+
+    prepared_sheets : iterable
+        The header, data_rows and clob_links of each table sheet, in the order of `table_dataframes`, as yielded 
+        by `_iter_prepared_sheets`.
+
+    include_record_count : bool
+        If True, adds a column to the index sheet that shows the number of records in each table.
+
+    Returns:
+    --------
+    None
+    """
+    workbook = xlsxwriter.Workbook(excel_file_path, {
+        'constant_memory': True,
+        'use_zip64': True,
+        'strings_to_urls': False,
+        'remove_timezone': True,
+        'default_date_format': 'yyyy-mm-dd h:mm:ss',
+    })
+
+    # Default Excel font size if not specified
+    standard_font_size = 11  
+
+    # Formats are created once and shared by every cell using them
+    header_format = add_header_format(workbook, font_size=standard_font_size)
+    link_format = workbook.add_format({'font_color': 'blue', 'underline': 1, 'font_size': standard_font_size})
+    return_link_format = workbook.add_format({'font_color': 'blue', 'underline': 1, 'font_size': standard_font_size + 1})
+    clob_link_format = workbook.get_default_url_format()
+
+    index_sheet = workbook.add_worksheet("Tables")
+
+    # Add headers to the index sheet
+    index_header = ["Table"]
+    if include_record_count:
+        index_header.append("Record Count")
+    index_sheet.write_row(0, 0, index_header, header_format)
+
+    # Populate the index sheet with links to each table sheet (and record counts if enabled)
+    index_rows = [index_header]
+    for r_idx, (item, item_data) in enumerate(table_dataframes.items(), start=1):
+        table_name = item_data['name']
+        dataframe = item_data['data']
+        index_sheet.write_url(r_idx, 0, f"internal:'{table_name}'!A1", link_format, string=table_name)
+        index_row = [table_name]
+        if include_record_count:
+            index_sheet.write_number(r_idx, 1, len(dataframe))
+            index_row.append(len(dataframe))
+        index_rows.append(index_row)
+
+    # Adjust column width for the index sheet
+    for c_idx, width in enumerate(compute_column_widths(index_rows)):
+        index_sheet.set_column(c_idx, c_idx, width)
+
+    # Apply a filter to all columns
+    index_sheet.autofilter(0, 0, len(index_rows) - 1, len(index_header) - 1)
+
+    for item_data, (header, data_rows, clob_links) in zip(table_dataframes.values(), prepared_sheets):
+        table_name = item_data['name']
+
+        # Create a new sheet with the table name
+        sheet = workbook.add_worksheet(table_name)
+
+        # Freeze first row (header)
+        sheet.freeze_panes(1, 0)
+
+        # Auto-size columns from a sample of the rows, instead of going through the whole table again
+        for c_idx, width in enumerate(compute_column_widths([header] + data_rows[:_WIDTH_SAMPLE_ROWS])):
+            sheet.set_column(c_idx, c_idx, width)
+
+        # Add a hyperlink to return to the "Tables" sheet in the last cell of the header row
+        sheet.write_row(0, 0, header, header_format)
+        sheet.write_url(0, len(header), "internal:'Tables'!A1", return_link_format, string="Return to Tables")
+
+        # Adjust the column width to fit the "Return to Tables" message.
+        sheet.set_column(len(header), len(header), len("Return to Tables") + 2)
+
+        if not clob_links:
+            # Tables without CLOB values only need their rows written, without looking for hyperlinks in each of them
+            for r_idx, row_values in enumerate(data_rows, start=1):
+                sheet.write_row(r_idx, 0, row_values)
+        else:
+            for r_idx, row_values in enumerate(data_rows):
+                sheet.write_row(r_idx + 1, 0, row_values)
+                # Create a hyperlink in the Excel cells to their CLOB text files. Excel allows a limited number of
+                # hyperlinks per sheet, beyond it the file name is kept as plain text
+                for c_idx, clob_filepath in clob_links.get(r_idx, ()):
+                    if sheet.write_url(r_idx + 1, c_idx, f"external:{clob_filepath}", clob_link_format, string=row_values[c_idx]) < 0:
+                        sheet.write_string(r_idx + 1, c_idx, row_values[c_idx])
+
+        # Apply a filter to all columns
+        sheet.autofilter(0, 0, len(data_rows), max(len(header) - 1, 0))
+
+    # Wait for the CLOB text files to be written, raising any error found while writing them, before saving the workbook
+    _finish_prepared_sheets(prepared_sheets)
+    workbook.close()
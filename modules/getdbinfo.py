@@ -1,18 +1,59 @@
-from sqlalchemy import create_engine, MetaData
+from sqlalchemy import bindparam, create_engine, event, text, MetaData
 from sqlalchemy.exc import SQLAlchemyError
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import cx_Oracle
 import pandas as pd
 import re
+import threading
 import time
 import pprint
 import json
 
 
+# Number of rows fetched from Oracle in each round trip by the bulk data queries (the driver default is 100)
+ARRAYSIZE = 10000
+# Rows returned by Oracle together with the execute call, one more than ARRAYSIZE to skip an extra round trip
+PREFETCHROWS = ARRAYSIZE + 1
+
+# Engines already created by connect_to_oracle, keyed by (host, port, service_name, username)
+_ENGINE_CACHE = {}
+# Serializes the creation of the engines, so threads connecting at the same time share a single engine and pool
+_ENGINE_LOCK = threading.Lock()
+# Connection pool settings of the engines: sessions kept open, extra sessions allowed and seconds before recycling one
+POOL_SIZE = 8
+POOL_MAX_OVERFLOW = 4
+POOL_RECYCLE = 1800
+# Number of parsed statements kept by each Oracle session, so the catalog queries repeated for every table are 
+# parsed once (the driver default is 20)
+STMT_CACHE_SIZE = 200
+# Major Oracle version of each engine, retrieved once by get_oracle_version
+_VERSION_CACHE = {}
+
+# Regular expressions used to parse the Oracle version, custom queries and check constraints
+_VERSION_RE = re.compile(r"(\d+)")
+_QUERY_FIELDS_RE = re.compile(r'SELECT\s+(.*?)\s+FROM', re.IGNORECASE | re.DOTALL)
+_QUERY_TABLE_RE = re.compile(r'FROM\s+([a-zA-Z0-9_\.]+)', re.IGNORECASE)
+_QUOTED_NAME_RE = re.compile(r'"([^"]+)"')
+# Semicolon ending a custom query, optionally followed by a line comment
+_QUERY_TERMINATOR_RE = re.compile(r';\s*(--[^\n]*)?\s*\Z')
+# Unquoted Oracle identifier, the only form accepted for the names that are spliced into the SQL text
+_IDENT_RE = re.compile(r'^[A-Z][A-Z0-9_$#]*$')
+# Maximum number of expressions in an IN list of an Oracle query
+MAX_IN_LIST_SIZE = 1000
+# Translation table that deletes the line breaks allowed by remove_illegal_chars
+_LINE_BREAKS_TABLE = str.maketrans('', '', '\n\r')
+
+
 def connect_to_oracle(host:str, port:int, service_name:str, username:str, password:str):
     """
     Function to connect to an Oracle database using SQLAlchemy and cx_Oracle.
     From version 8 onwards, cx_Oracle has been renamed to oracledb, though cx_Oracle is still functional in earlier versions.
 
+    The engine is created once for each database and user, and the following calls return the same engine, also 
+    when they are made at the same time from several threads. Its connection pool keeps the Oracle sessions open 
+    between calls, so each table extracted does not have to log in to the database again.
+
     Parameters:
     - host: The address of the database server.
     - port: The port where the database server is listening.
@@ -24,15 +65,88 @@ def connect_to_oracle(host:str, port:int, service_name:str, username:str, passwo
     - engine: SQLAlchemy Engine object if the connection is successful.
     - None: If an error occurs during the connection.
     """
+    engine_key = (host, port, service_name, username)
+    engine = _ENGINE_CACHE.get(engine_key)
+    if engine is not None:
+        return engine
+
     # Create the connection string in the format required by SQLAlchemy and cx_Oracle
     connection_string = f'oracle+cx_oracle://{username}:{password}@{host}:{port}/?service_name={service_name}'
     
+    with _ENGINE_LOCK:
+        # Another thread may have created the engine while this one was waiting for the lock
+        engine = _ENGINE_CACHE.get(engine_key)
+        if engine is not None:
+            return engine
+
+        try:
+            # Pooled sessions are checked before being reused and recycled periodically, so a session closed by the
+            # server is replaced transparently
+            engine = create_engine(connection_string, pool_size=POOL_SIZE, max_overflow=POOL_MAX_OVERFLOW, 
+                                   pool_pre_ping=True, pool_recycle=POOL_RECYCLE)
+            event.listen(engine, 'connect', _set_statement_cache_size)
+            _ENGINE_CACHE[engine_key] = engine
+            return engine
+        except SQLAlchemyError as e:
+            print(f"Error connecting to the database: {e}")
+            return None
+
+
+def _set_statement_cache_size(dbapi_connection, connection_record):
+    """
+    Sets the statement cache size of each new cx_Oracle connection of an engine, used as a 'connect' event listener.
+    """
+    dbapi_connection.stmtcachesize = STMT_CACHE_SIZE
+
+
+def _safe_ident(name: str):
+    """
+    Validates an identifier (e.g. an owner or a table name) that has to be spliced into the SQL text because it 
+    can't be a bind variable.
+
+    Parameters:
+    -----------
+    name : str
+        The identifier.
+
+    Returns:
+    --------
+    str
+        The identifier in upper case, which is how Oracle resolves unquoted identifiers.
+
+    Exceptions:
+    -----------
+    ValueError
+        If the name is not a valid unquoted Oracle identifier.
+    """
+    ident = str(name).upper()
+    if not _IDENT_RE.match(ident):
+        raise ValueError(f"Invalid Oracle identifier: {name!r}")
+    return ident
+
+
+def _get_max_workers(connection_info: dict):
+    """
+    Returns the number of tables extracted at the same time, taken from the optional `max_workers` entry of the 
+    connection information (the `<ENVIRONMENT>_<COMPLEX>_<VERSION>_MAX_WORKERS` variable of the connection in the 
+    `.env` file, e.g. `DES_COR_V8_MAX_WORKERS`).
+
+    It defaults to `POOL_SIZE` and is capped at the number of sessions the engine pool can open, so no thread 
+    waits for a free session.
+
+    Exceptions:
+    -----------
+    ValueError
+        If the value is not a positive integer.
+    """
+    value = connection_info.get('max_workers') or POOL_SIZE
     try:
-        engine = create_engine(connection_string)
-        return engine
-    except SQLAlchemyError as e:
-        print(f"Error connecting to the database: {e}")
-        return None
+        max_workers = int(value)
+    except ValueError:
+        max_workers = 0
+    if max_workers < 1:
+        raise ValueError(f"Invalid MAX_WORKERS value {value!r} in the connection settings, it must be a positive integer")
+    return min(max_workers, POOL_SIZE + POOL_MAX_OVERFLOW)
 
 
 def get_oracle_version(engine):
@@ -42,6 +156,7 @@ def get_oracle_version(engine):
     This function queries the `v$version` view to obtain the Oracle database version.
     It extracts the major version number (e.g., 12, 11) from the version string and returns
     it as an integer for easy comparison.
+    The version is only queried the first time for each engine, the following calls return the cached value.
 
     Parameters:
     -----------
@@ -68,7 +183,10 @@ def get_oracle_version(engine):
     else:
         print("Unable to retrieve Oracle version.")
     """
-    
+    oracle_version = _VERSION_CACHE.get(engine)
+    if oracle_version is not None:
+        return oracle_version
+
     with engine.connect() as connection:
         version_query = "SELECT banner FROM v$version WHERE banner LIKE 'Oracle%'"
         try:
@@ -76,9 +194,10 @@ def get_oracle_version(engine):
             oracle_version_str = version_df.iloc[0, 0]
             
             # Use regex to extract the first two digits (major version)
-            match = re.search(r"(\d+)", oracle_version_str)
+            match = _VERSION_RE.search(oracle_version_str)
             if match:
                 oracle_version = int(match.group(1))
+                _VERSION_CACHE[engine] = oracle_version
                 return oracle_version
             else:
                 print(f"Unable to parse Oracle version from: {oracle_version_str}")
@@ -88,6 +207,135 @@ def get_oracle_version(engine):
             return None
 
 
+def read_sql_bulk(query, connection, chunksize=None, params=None, max_rows=None):
+    """
+    Runs a query on an open connection and returns its result as a DataFrame, fetching the rows from Oracle in 
+    large batches.
+
+    It is a replacement of `pd.read_sql` for the queries that retrieve the data of the tables. Those queries can 
+    return tens of thousands of rows, and with the default cursor arraysize each batch of 100 rows is a round trip 
+    to the server. The raw cursor of the SQLAlchemy connection keeps the output type handlers of the dialect, so 
+    the values and the (lower case) column names are the same as the ones returned by `pd.read_sql`.
+
+    Parameters:
+    -----------
+    query : str
+        The SQL query to be executed.
+    connection : sqlalchemy.engine.base.Connection
+        The open SQLAlchemy connection used to run the query.
+    chunksize : int, optional
+        If given, the rows are fetched and converted to DataFrames in chunks of this size by `iter_sql_bulk`, 
+        which are concatenated at the end. Only the rows of one chunk are kept as Python tuples at a time, instead of the whole result set.
+    params : dict, optional
+        The values of the bind variables of the query (e.g. {'owner': owner} for `:owner`).
+    max_rows : int, optional
+        If given, no more than this number of rows are fetched, and the cursor is closed without fetching the rest.
+
+    Returns:
+    --------
+    pd.DataFrame
+        The rows returned by the query.
+
+    Exceptions:
+    -----------
+    cx_Oracle.Error
+        If an error occurs while executing the query or fetching its rows.
+    """
+    if chunksize is not None:
+        chunks = list(iter_sql_bulk(query, connection, chunksize, params=params, max_rows=max_rows))
+        if len(chunks) == 1:
+            return chunks[0]
+        # A column can be inferred with a different type in each chunk (e.g. a chunk with only nulls), so the types 
+        # are inferred again over the whole result, as if it had been converted at once
+        return pd.concat(chunks, ignore_index=True).infer_objects()
+
+    cursor = connection.connection.cursor()
+    try:
+        cursor.arraysize = ARRAYSIZE
+        cursor.prefetchrows = PREFETCHROWS
+        cursor.execute(query, params or {})
+        # Oracle returns unquoted names in upper case, normalize them the same way SQLAlchemy does
+        columns = [connection.dialect.normalize_name(description[0]) for description in cursor.description]
+        if max_rows is None:
+            rows = cursor.fetchall()
+        else:
+            rows = cursor.fetchmany(max_rows) if max_rows > 0 else []
+        return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+    finally:
+        cursor.close()
+
+
+def iter_sql_bulk(query, connection, chunksize, params=None, max_rows=None):
+    """
+    Runs a query on an open connection and yields its result as DataFrames of up to `chunksize` rows, fetching 
+    the rows from Oracle in large batches like `read_sql_bulk`.
+
+    Oracle keeps the result set on the server and the cursor fetches it as the chunks are requested, so only the 
+    rows of the chunk being consumed are kept in memory. The query is not executed until the first chunk is 
+    requested, and the connection must stay open until the last one.
+
+    Parameters:
+    -----------
+    query : str
+        The SQL query to be executed.
+    connection : sqlalchemy.engine.base.Connection
+        The open SQLAlchemy connection used to run the query.
+    chunksize : int
+        The maximum number of rows of each DataFrame.
+    params : dict, optional
+        The values of the bind variables of the query (e.g. {'owner': owner} for `:owner`).
+    max_rows : int, optional
+        If given, no more than this number of rows are fetched, and the cursor is closed without fetching the rest.
+
+    Yields:
+    -------
+    pd.DataFrame
+        The rows returned by the query, in chunks of `chunksize` rows. At least one DataFrame is yielded, empty 
+        (but with its columns) if the query returns no rows.
+
+    Exceptions:
+    -----------
+    cx_Oracle.Error
+        If an error occurs while executing the query or fetching its rows.
+    """
+    cursor = connection.connection.cursor()
+    try:
+        cursor.arraysize = ARRAYSIZE
+        cursor.prefetchrows = PREFETCHROWS
+        cursor.execute(query, params or {})
+        # Oracle returns unquoted names in upper case, normalize them the same way SQLAlchemy does
+        columns = [connection.dialect.normalize_name(description[0]) for description in cursor.description]
+        first_chunk = True
+        remaining_rows = max_rows
+        while True:
+            fetch_size = chunksize if remaining_rows is None else min(chunksize, remaining_rows)
+            rows = cursor.fetchmany(fetch_size) if fetch_size > 0 else []
+            # The last fetch is empty when the number of rows is a multiple of chunksize, and it's only yielded if 
+            # there are no rows at all
+            if rows or first_chunk:
+                yield pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+            first_chunk = False
+            if remaining_rows is not None:
+                remaining_rows -= len(rows)
+                if remaining_rows <= 0:
+                    break
+            if len(rows) < fetch_size:
+                break
+    finally:
+        cursor.close()
+
+
+def _read_sql_bulk_with_engine(engine, query, params=None):
+    """
+    Runs `read_sql_bulk` on a connection of its own drawn from the engine pool, so several queries can run at the 
+    same time from different threads.
+
+    See `read_sql_bulk` for the parameters and the returned value.
+    """
+    with engine.connect() as connection:
+        return read_sql_bulk(query, connection, params=params)
+
+
 def remove_illegal_chars(value):
     """
     Removes illegal or non-printable characters from a string, except for newline (\n) and carriage return (\r).
@@ -105,10 +353,47 @@ def remove_illegal_chars(value):
     """
 
     if isinstance(value, str):
-        return ''.join(c for c in value if c.isprintable() or c in ('\n', '\r'))
+        # Most strings have nothing to remove, which is checked in C before filtering them character by character
+        if value.translate(_LINE_BREAKS_TABLE).isprintable():
+            return value
+        # Only the distinct characters are checked in Python, the illegal ones are then deleted in a single regex pass
+        illegal_chars = [c for c in set(value) if not c.isprintable() and c not in ('\n', '\r')]
+        return re.sub('[' + re.escape(''.join(illegal_chars)) + ']', '', value)
     return value
 
 
+def clean_dataframe_strings(df):
+    """
+    Removes illegal or non-printable characters from the string columns of a DataFrame, except for newline (\n) 
+    and carriage return (\r), following the same rule as `remove_illegal_chars`.
+
+    Instead of cleaning the values one by one, the strings of each column are checked together in a single pass, 
+    and only the columns that contain any character to remove are cleaned.
+
+    It is a helper for callers of the `get_dbinfo_*` functions and is not used by the dump functions: the Excel
+    writers only remove the control characters that Excel rejects (see `dumpdbinfo.clean_value`), and keep tabs
+    and other characters that this rule would remove.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        The DataFrame to be cleaned. Its string columns are modified in place.
+
+    Returns:
+    --------
+    pd.DataFrame
+        The same DataFrame, with its string values cleaned.
+    """
+    for column in df.select_dtypes(include='object').columns:
+        values = df[column]
+        if pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            # Columns with only printable characters and line breaks are left untouched
+            if ''.join(values.dropna().tolist()).translate(_LINE_BREAKS_TABLE).isprintable():
+                continue
+        df[column] = values.map(remove_illegal_chars)
+    return df
+
+
 def extract_query_info(sql_query):
     """
     Extracts the table name and a list of selected fields from a given SQL query.
@@ -142,10 +427,10 @@ def extract_query_info(sql_query):
         # fields_list -> ['sample_number', 'sampled_date', 'text_id', 'status']
     """
     # Regular expression to capture the fields between SELECT and FROM
-    fields_match = re.search(r'SELECT\s+(.*?)\s+FROM', sql_query, re.IGNORECASE | re.DOTALL)
+    fields_match = _QUERY_FIELDS_RE.search(sql_query)
     
     # Regular expression to capture the table name after the FROM clause
-    table_match = re.search(r'FROM\s+([a-zA-Z0-9_\.]+)', sql_query, re.IGNORECASE)
+    table_match = _QUERY_TABLE_RE.search(sql_query)
     
     if not fields_match or not table_match:
         return None, None
@@ -169,6 +454,54 @@ def extract_query_info(sql_query):
     return table_name, fields_list
 
 
+def limit_custom_query(sql_query: str, fields_list: list, max_records_per_table: int, is_version_12c_or_higher: bool):
+    """
+    Limits the number of rows returned by a custom SQL query, wrapping it in a `FETCH FIRST N ROWS ONLY` clause 
+    (or `ROWNUM` before Oracle 12c) when it can be wrapped safely.
+
+    The ending semicolon of the query is removed (also when it is followed by spaces or a line comment), and the 
+    query is wrapped between new lines, so a line comment at its end does not comment out the closing parenthesis. 
+    The query is not wrapped when its select list has a `*` or a repeated column name, because the outer 
+    `SELECT *` would fail with ORA-00918 on columns with the same name. In that case the query is returned as it is, 
+    and the caller must stop fetching rows after `max_records_per_table`.
+
+    Parameters:
+    -----------
+    sql_query : str
+        The custom SQL query.
+    fields_list : list
+        The fields of the select list of the query, as returned by `extract_query_info`.
+    max_records_per_table : int
+        The maximum number of rows returned by the query.
+    is_version_12c_or_higher : bool
+        Whether the database is Oracle 12c or higher.
+
+    Returns:
+    --------
+    str
+        The query with the row limit, or the query without its ending semicolon if it can't be wrapped.
+
+    Example:
+    --------
+    limit_custom_query("SELECT ID, NAME FROM SAMPLE; -- samples", ['ID', 'NAME'], 10, True)
+    # -> "SELECT * FROM (\nSELECT ID, NAME FROM SAMPLE\n) FETCH FIRST 10 ROWS ONLY"
+    """
+    custom_query = sql_query.strip()
+    # The semicolon is only removed when it is not inside a string literal (with an odd number of quotes before it)
+    match = _QUERY_TERMINATOR_RE.search(custom_query)
+    if match and custom_query.count("'", 0, match.start()) % 2 == 0:
+        custom_query = custom_query[:match.start()].rstrip()
+
+    # The name of each column is its alias, or the column name without the table alias
+    column_names = [field.split()[-1].strip('"') if field.split() else field for field in fields_list]
+    if any('*' in name for name in column_names) or len(set(column_names)) < len(column_names):
+        return custom_query
+
+    if is_version_12c_or_higher:
+        return f"SELECT * FROM (\n{custom_query}\n) FETCH FIRST {max_records_per_table} ROWS ONLY"
+    return f"SELECT * FROM (\n{custom_query}\n) WHERE ROWNUM <= {max_records_per_table}"
+
+
 def print_column_types(table_dict):
     """
     Prints the data types of the columns for each table in the table_dict dictionary.
@@ -319,41 +652,54 @@ def get_dbinfo_metadata(connection_info: dict):
     # First, we retrieve the fields of the column name, its type and length for the main catalog tables.
     # These values will be stored in the “fields” key of the dictionary with the catalog data.
     # We will need this information later to determine if a field is CLOB.
+    # The fields of all the catalog tables are retrieved with a single query, instead of one query for each of them.
     with engine.connect() as connection:
-        for catalog_table, table_info in catalog_tables.items():
-            table_name = table_info['name']
-            query = f"select column_name, data_type, data_length from SYS.ALL_TAB_COLS where TABLE_name = '{table_name}' order by COLUMN_ID"
-            try:
-                df = pd.read_sql(query, connection)
-                fields_dict = {}
-                for _, row in df.iterrows():
-                    column_name = row['column_name']
-                    fields_dict[column_name] = {
-                        "data_type": row['data_type'],
-                        "data_length": row['data_length']
-                    }
-                catalog_tables[catalog_table]["fields"] = fields_dict
-            except SQLAlchemyError as e:
-                print(f"Error retrieving {catalog_table}: {e}")
-                catalog_tables[catalog_table]["fields"] = {}
+        catalog_table_keys = {table_info['name']: catalog_table for catalog_table, table_info in catalog_tables.items()}
+        query = text("""
+            select table_name, column_name, data_type, data_length from SYS.ALL_TAB_COLS 
+            where TABLE_name in :table_names order by TABLE_name, COLUMN_ID
+        """).bindparams(bindparam('table_names', expanding=True))
+        try:
+            result = connection.execute(query, {'table_names': list(catalog_table_keys)})
+            for table_name, column_name, data_type, data_length in result:
+                catalog_tables[catalog_table_keys[table_name]]["fields"][column_name] = {
+                    "data_type": data_type,
+                    "data_length": data_length
+                }
+        except SQLAlchemyError as e:
+            print(f"Error retrieving catalog fields: {e}")
+            for table_info in catalog_tables.values():
+                table_info["fields"] = {}
 
     # Now we use the information in the list of fields to retrieve all the information contained in the main tables of the catalog.
     # We also use the predefined information about the owner of the tables and the order of retrieval of the query.
     # The retrieved information will be stored in the “data” key of the dictionary with the catalog tables.
-        for catalog_table, table_info in catalog_tables.items():
-
-            table_name = table_info['name']
-            order = table_info['order']
-            field_owner = table_info['field_owner']
-            fields = ', '.join(f"{fld}" for fld in list(table_info['fields'].keys()))
-            query = f"select {fields} from sys.{table_name} where {field_owner} = '{owner}' order by {order}"
-
-            try:
-                df = pd.read_sql(query, connection)
-                catalog_tables[catalog_table]["data"] = df 
-            except SQLAlchemyError as e:
-                print(f"Error retrieving {catalog_table}: {e}")
-                catalog_tables[catalog_table]["data"] = pd.DataFrame()
+    # The queries are independent, so they run at the same time, each one on its own pooled session.
+    # The rows are sorted afterwards in pandas, which saves Oracle from sorting the larger views on the server.
+        with ThreadPoolExecutor(max_workers=len(catalog_tables)) as executor:
+            futures = {}
+            for catalog_table, table_info in catalog_tables.items():
+
+                table_name = table_info['name']
+                field_owner = table_info['field_owner']
+                fields = ', '.join(f"{fld}" for fld in list(table_info['fields'].keys()))
+                query = f"select {fields} from sys.{table_name} where {field_owner} = :owner"
+                futures[catalog_table] = executor.submit(_read_sql_bulk_with_engine, engine, query, {'owner': owner})
+
+            for catalog_table, future in futures.items():
+                try:
+                    df = future.result()
+                    # Stable sort, so rows with the same value keep the order in which Oracle returned them. A view 
+                    # without the order column (e.g. in another Oracle version) keeps the rows unsorted
+                    order = catalog_tables[catalog_table]['order'].lower()
+                    if order in df.columns:
+                        df = df.sort_values(order, kind='mergesort', ignore_index=True)
+                    else:
+                        print(f"Column {order} not found in {catalog_table}, its rows are not sorted")
+                    catalog_tables[catalog_table]["data"] = df
+                except (SQLAlchemyError, cx_Oracle.Error) as e:
+                    print(f"Error retrieving {catalog_table}: {e}")
+                    catalog_tables[catalog_table]["data"] = pd.DataFrame()
 
         # Define the generic fields that we want to extract from non-catalog tables.
         # These fields represent common metadata such as column name, data type, length, etc.
@@ -370,17 +716,28 @@ def get_dbinfo_metadata(connection_info: dict):
     # Finally, we retrieve the catalog information of all tables defined in ALL_TABLES and create an entry for each table in the catalog information dictionary.
     # We also filter out columns that start with 'SYS_' because these are internal system fields defined by Oracle, and not part of user-defined schema.
         all_tables_df = catalog_tables["tables"]["data"] 
-        for _, row in all_tables_df.iterrows():
-            table_name = row['table_name']
-            query = f"""
-                SELECT COLUMN_name, DATA_TYPE, DATA_LENGTH, DATA_PRECISION, DATA_SCALE, NULLABLE, COLUMN_ID
-                FROM SYS.ALL_TAB_COLS 
-                WHERE TABLE_name = '{table_name}' 
-                AND COLUMN_name NOT LIKE 'SYS\_%' ESCAPE '\\'
-                ORDER BY COLUMN_name
-            """
-            try:
-                df = pd.read_sql(query, connection)
+        table_names = all_tables_df['table_name'].tolist() if not all_tables_df.empty else []
+
+        # The columns of all the tables are retrieved with a single query instead of one query for each table
+        query = text(r"""
+            SELECT TABLE_name, COLUMN_name, DATA_TYPE, DATA_LENGTH, DATA_PRECISION, DATA_SCALE, NULLABLE, COLUMN_ID
+            FROM SYS.ALL_TAB_COLS 
+            WHERE TABLE_name IN (SELECT TABLE_name FROM SYS.ALL_TABLES WHERE OWNER = :owner)
+            AND COLUMN_name NOT LIKE 'SYS\_%' ESCAPE '\'
+            ORDER BY TABLE_name, COLUMN_name
+        """)
+        try:
+            result = connection.execute(query, {'owner': owner})
+            columns = list(result.keys())[1:]
+            table_rows = {table_name: [] for table_name in table_names}
+            for row in result:
+                if row[0] in table_rows:
+                    table_rows[row[0]].append(tuple(row[1:]))
+
+            # Each table gets its own DataFrame built from its rows, so the column types are inferred per table 
+            # like when they were queried separately
+            for table_name in table_names:
+                df = pd.DataFrame.from_records(table_rows[table_name], columns=columns, coerce_float=True)
                 catalog_tables[table_name] = {
                     "name": table_name,
                     "order": "",
@@ -389,14 +746,208 @@ def get_dbinfo_metadata(connection_info: dict):
                     "fields": generic_fields,  
                     "data": df
                 }
-            except SQLAlchemyError as e:
-                print(f"Error retrieving column information for table {table_name}: {e}")
-
+        except SQLAlchemyError as e:
+            print(f"Error retrieving column information for tables: {e}")
 
     return catalog_tables
 
 
-def get_dbinfo_table(connection_info: dict, table_name: str, sql_filter: str = None, sql_query: str = None, max_records_per_table: int = 50000):
+def _extract_table_impl(connection, owner: str, table_name: str, sql_filter: str, sql_query: str, max_records_per_table: int, 
+                        is_version_12c_or_higher: bool, chunksize: int = 5000, fetch_data: bool = True, prefetched_fields: dict = None, 
+                        stream: bool = False):
+    """
+    Retrieves the fields, indexes and data of a table on an open connection. It does the work of `get_dbinfo_table`, 
+    which callers extracting many tables can skip to reuse a connection and the Oracle version across all of them.
+
+    Parameters:
+    -----------
+    connection : sqlalchemy.engine.base.Connection
+        The open SQLAlchemy connection used to run the queries.
+    owner : str
+        The owner of the table.
+    is_version_12c_or_higher : bool
+        Whether the database is Oracle 12c or higher.
+    fetch_data : bool, optional
+        If False, the data query is skipped and the table gets an empty DataFrame with its columns. Used for the 
+        tables known to be empty. Defaults to True.
+    prefetched_fields : dict, optional
+        The fields of the table, as returned by `get_tables_fields`. If given, they are not queried again. 
+        Defaults to None.
+    stream : bool, optional
+        If True, the data of the table is not fetched, and it is returned instead as the generator of `iter_sql_bulk` 
+        yielding DataFrames of `chunksize` rows. The connection must stay open until the generator is consumed, and 
+        the errors of the data query are raised while consuming it. Defaults to False.
+
+    The rest of the parameters and the returned value are the same as in `get_dbinfo_table`.
+    """
+    print(f'Extracting data from Oracle table {table_name}...')
+    table_dict = {}
+
+    # The owner and the table name are part of the data query text, so they are validated before using them
+    try:
+        owner_ident = _safe_ident(owner)
+        table_ident = _safe_ident(table_name) if sql_query is None else None
+    except ValueError as e:
+        print(f"Error retrieving {table_name}: {e}")
+        return None
+
+    # If sql_query is provided, extract table name and fields from it
+    if sql_query is not None:
+        extracted_table_name, extracted_fields_list = extract_query_info(sql_query)
+        
+        # If the extracted table name or fields list is None, return None as something went wrong
+        if extracted_table_name is None or extracted_fields_list is None:
+            return None
+        
+        table_name = extracted_table_name
+        fields_list = extracted_fields_list
+
+    # Next, we retrieve the table's columns
+    if sql_query is None:
+        query = text(r"""
+            SELECT COLUMN_name, DATA_TYPE, DATA_LENGTH
+            FROM SYS.ALL_TAB_COLS 
+            WHERE TABLE_name = :table_name 
+            AND COLUMN_name NOT LIKE 'SYS\_%' ESCAPE '\'
+            AND COLUMN_name NOT LIKE 'AUDIT%'
+            ORDER BY COLUMN_ID
+        """)
+        params = {'table_name': table_name}
+    else:
+        # The list of fields is bound as an expanding parameter (:field_1, :field_2, ...)
+        query = text(r"""
+            SELECT COLUMN_name, DATA_TYPE, DATA_LENGTH 
+            FROM SYS.ALL_TAB_COLS 
+            WHERE TABLE_name = :table_name 
+            AND COLUMN_name IN :fields
+            AND COLUMN_name NOT LIKE 'SYS\_%' ESCAPE '\' 
+            ORDER BY COLUMN_ID
+            """).bindparams(bindparam('fields', expanding=True))
+        params = {'table_name': table_name, 'fields': fields_list}
+
+    fields_dict = {}
+    try:
+        if prefetched_fields is not None:
+            # The fields were already retrieved by the caller, together with the ones of other tables
+            fields_dict = prefetched_fields
+        else:
+            df = pd.read_sql(query, connection, params=params)
+            # Build the fields from the result columns, without boxing each row into a Series
+            fields_dict = {
+                column_name: {
+                    "data_type": data_type,
+                    "data_length": data_length
+                }
+                for column_name, data_type, data_length in zip(df['column_name'].tolist(), df['data_type'].tolist(), df['data_length'].tolist())
+            }
+        table_dict[table_name] = {
+            "name": table_name,
+            "order": "",
+            "field_owner": "",
+            "index": [],
+            "fields": fields_dict,
+            "data": pd.DataFrame()
+        }
+    except SQLAlchemyError as e:
+        print(f"Error retrieving {table_name}: {e}")
+        table_dict[table_name]["fields"] = {}
+
+    # Maximum number of rows fetched, for the queries whose SQL text can't limit them
+    max_rows = None
+    if sql_query is None:
+        index_list = []
+        # Use the column search_condition_vc if it's Oracle 12c or higher, otherwise use search_condition
+        search_condition_column = "SEARCH_CONDITION_VC" if is_version_12c_or_higher else "SEARCH_CONDITION"
+
+        # Retrieve the unique index and its fields if it exists
+        #                 ORDER BY TO_CHAR({search_condition_column})
+        if is_version_12c_or_higher:
+            # The field name inside quotes is extracted by Oracle, so only the names are sent instead of the 
+            # whole search conditions
+            query = text(f"""
+                SELECT REGEXP_SUBSTR({search_condition_column}, '"([^"]+)"', 1, 1, NULL, 1) AS field_name 
+                FROM SYS.ALL_CONSTRAINTS s 
+                WHERE s.TABLE_name = :table_name 
+                AND s.CONSTRAINT_TYPE = 'C'
+            """)
+        else:
+            # SEARCH_CONDITION is a LONG column, which can't be used in REGEXP_SUBSTR
+            query = text(f"""
+                SELECT {search_condition_column} 
+                FROM SYS.ALL_CONSTRAINTS s 
+                WHERE s.TABLE_name = :table_name 
+                AND s.CONSTRAINT_TYPE = 'C'
+            """)
+        try:
+            df = pd.read_sql(query, connection, params={'table_name': table_name})
+            if not df.empty:
+                if is_version_12c_or_higher:
+                    index_list = [field_name for field_name in df['field_name'].tolist() if field_name]
+                else:
+                    index_list = []
+                    for condition in df[search_condition_column.lower()].tolist():
+                        # Use a regular expression to capture the field name inside quotes
+                        match = _QUOTED_NAME_RE.search(condition)
+                        if match:
+                            field_name = match.group(1)  # Extract the field name without the quotes
+                            index_list.append(field_name)
+                        
+                # ordenamos la lista
+                index_list.sort()
+                table_dict[table_name]["index"] = index_list
+
+        except SQLAlchemyError as e:
+            print(f"Error retrieving index of {table_name}: {e}")
+            table_dict[table_name]["index"] = []
+
+        fields = ', '.join(f"{fld}" for fld in list(fields_dict.keys()))
+        index = ', '.join(f"{fld}" for fld in index_list)
+        # Construct the basic SQL query to select fields from the specified table
+        query = f"SELECT {fields} FROM {owner_ident}.{table_ident}"
+        # Create the ORDER BY clause if there are any indexed fields
+        query2 = f"ORDER BY {index}" 
+        # Create the clause to limit the number of rows returned by the query
+        query3 = f"FETCH FIRST {max_records_per_table} ROWS ONLY"
+        # If a SQL filter is provided, append it to the query
+        if sql_filter is not None:
+            query = query + ' ' + sql_filter
+            print(f'Query with added filter: {query}')
+        # If there are indexed fields, append the ORDER BY clause to the query
+        if len(index_list) > 0:
+            query = query + ' ' + query2
+        # Finally, append the row limit clause to the query
+        if is_version_12c_or_higher:
+            query = query + ' ' + query3 
+        else:
+            query = f"SELECT * FROM ({query}) WHERE ROWNUM <= {max_records_per_table}"
+    else:
+        # Push the row limit down to the custom query when it can be wrapped, so only the records that will be 
+        # dumped are fetched. Otherwise, the fetch stops after them
+        query = limit_custom_query(sql_query, fields_list, max_records_per_table, is_version_12c_or_higher)
+        max_rows = max_records_per_table
+        print(f'Custom query: {query}')
+
+    if not fetch_data:
+        # Same columns, in the same (lower case) form, as the data query would have returned
+        table_dict[table_name]["data"] = pd.DataFrame(columns=[connection.dialect.normalize_name(fld) for fld in fields_dict])
+        return table_dict
+
+    if stream:
+        table_dict[table_name]["data"] = iter_sql_bulk(query, connection, chunksize, max_rows=max_rows)
+        return table_dict
+
+    try:
+        df = read_sql_bulk(query, connection, chunksize=chunksize, max_rows=max_rows)
+        table_dict[table_name]["data"] = df
+    except (SQLAlchemyError, cx_Oracle.Error) as e:
+        print(f"Error retrieving {table_name}: {e}")
+        table_dict[table_name]["data"] = pd.DataFrame()
+
+    # print_column_types(table_dict)
+    return table_dict
+
+
+def get_dbinfo_table(connection_info: dict, table_name: str, sql_filter: str = None, sql_query: str = None, max_records_per_table: int = 50000, chunksize: int = 5000):
     """
     Retrieve detailed information from the specified table in the Oracle database, including field names, types,
     lengths, indexes, and data, with an optional limit on the number of records retrieved.
@@ -415,7 +966,11 @@ def get_dbinfo_table(connection_info: dict, table_name: str, sql_filter: str = N
         are extracted from this query.
     max_records_per_table : int, optional, default=50000
         The maximum number of records to retrieve from the table. This limit will be applied to the result set 
-        using a `FETCH FIRST N ROWS ONLY` clause.
+        using a `FETCH FIRST N ROWS ONLY` clause (or `ROWNUM` before Oracle 12c), also when a custom `sql_query` 
+        is provided.
+    chunksize : int, optional, default=5000
+        The number of rows fetched and converted to a DataFrame at a time, to limit the memory used while the data 
+        of the table is retrieved. If None, all the rows are fetched at once.
 
     Returns:
     --------
@@ -423,7 +978,6 @@ def get_dbinfo_table(connection_info: dict, table_name: str, sql_filter: str = N
         A dictionary containing detailed information about the specified table, including fields, indexes, and 
         data. Returns None if an error occurs or no data is retrieved.
     """
-    print(f'Extracting data from Oracle table {table_name}...')
     host = connection_info['host']
     port = connection_info['port']
     service_name = connection_info['service_name']
@@ -435,8 +989,6 @@ def get_dbinfo_table(connection_info: dict, table_name: str, sql_filter: str = N
     if engine is None:
         return None
 
-    table_dict = {}
-
     # Obtain Oracle database version using the get_oracle_version function
     oracle_version = get_oracle_version(engine)
     if oracle_version is None:
@@ -446,130 +998,304 @@ def get_dbinfo_table(connection_info: dict, table_name: str, sql_filter: str = N
     # Check if the version is 12 or higher
     is_version_12c_or_higher = oracle_version >= 12
 
-    # If sql_query is provided, extract table name and fields from it
-    if sql_query is not None:
-        extracted_table_name, extracted_fields_list = extract_query_info(sql_query)
-        
-        # If the extracted table name or fields list is None, return None as something went wrong
-        if extracted_table_name is None or extracted_fields_list is None:
-            return None
-        
-        table_name = extracted_table_name
-        fields_list = extracted_fields_list
-        fields = ', '.join(fields_list)
+    with engine.connect() as connection:
+        return _extract_table_impl(connection, owner, table_name, sql_filter, sql_query, max_records_per_table, 
+                                   is_version_12c_or_higher, chunksize)
 
-    # Next, we retrieve the table's columns
+
+def get_dbinfo_table_iter(connection_info: dict, table_name: str, sql_filter: str = None, sql_query: str = None, 
+                          max_records_per_table: int = 50000, chunksize: int = 5000):
+    """
+    Retrieves the same information as `get_dbinfo_table`, but yields the data of the table in chunks instead of 
+    returning all its rows together.
+
+    The rows are fetched from the server as the chunks are consumed, so a caller that writes each chunk and then 
+    drops it only keeps `chunksize` rows in memory, however large the CLOB values of the table are.
+
+    Parameters:
+    -----------
+    The parameters are the same as in `get_dbinfo_table`. `chunksize` is the maximum number of rows of each chunk.
+
+    Yields:
+    -------
+    dict
+        A dictionary with the same structure as the one returned by `get_dbinfo_table`, whose data holds the rows 
+        of one chunk. The fields and indexes are the same in all of them. At least one dictionary is yielded if 
+        the table exists, with an empty DataFrame if it has no rows. Nothing is yielded if an error occurs before 
+        the data query, and no more chunks are yielded if it fails.
+    """
+    host = connection_info['host']
+    port = connection_info['port']
+    service_name = connection_info['service_name']
+    username = connection_info['user']
+    password = connection_info['password']
+    owner = connection_info['owner']
+    engine = connect_to_oracle(host, port, service_name, username, password)
+
+    if engine is None:
+        return
+
+    oracle_version = get_oracle_version(engine)
+    if oracle_version is None:
+        print("Error retrieving Oracle version")
+        return
+
+    # Check if the version is 12 or higher
+    is_version_12c_or_higher = oracle_version >= 12
+
+    # The connection is kept open while the chunks are consumed, because the rows are fetched as they are requested
     with engine.connect() as connection:
-        if sql_query is None:
-            query = f"""
-                SELECT COLUMN_name, DATA_TYPE, DATA_LENGTH
-                FROM SYS.ALL_TAB_COLS 
-                WHERE TABLE_name = '{table_name}' 
-                AND COLUMN_name NOT LIKE 'SYS\_%' ESCAPE '\\'
-                AND COLUMN_name NOT LIKE 'AUDIT%'
-                ORDER BY COLUMN_ID
-            """
-        else:
-            # Convertimos la lista de campos a una cadena compatible con SQL ('field1', 'field2', ...)
-            fields_string = ', '.join(f"'{field}'" for field in fields_list)
-            query = f"""
-                SELECT COLUMN_name, DATA_TYPE, DATA_LENGTH 
-                FROM SYS.ALL_TAB_COLS 
-                WHERE TABLE_name = '{table_name}' 
-                AND COLUMN_name IN ({fields_string})
-                AND COLUMN_name NOT LIKE 'SYS\_%' ESCAPE '\\' 
-                ORDER BY COLUMN_ID
-                """
-
-        fields_dict = {}
+        table_dict = _extract_table_impl(connection, owner, table_name, sql_filter, sql_query, max_records_per_table, 
+                                         is_version_12c_or_higher, chunksize, stream=True)
+        if table_dict is None:
+            return
+
+        table_name, table_info = next(iter(table_dict.items()))
+        chunks = table_info['data']
         try:
-            df = pd.read_sql(query, connection)
-            for _, row in df.iterrows():
-                column_name = row['column_name']
-                fields_dict[column_name] = {
-                    "data_type": row['data_type'],
-                    "data_length": row['data_length']
-                }
-            table_dict[table_name] = {
-                "name": table_name,
-                "order": "",
-                "field_owner": "",
-                "index": [],
-                "fields": fields_dict,
-                "data": pd.DataFrame()
-            }
-        except SQLAlchemyError as e:
+            for df in chunks:
+                yield {table_name: {**table_info, 'data': df}}
+        except (SQLAlchemyError, cx_Oracle.Error) as e:
             print(f"Error retrieving {table_name}: {e}")
-            table_dict[table_name]["fields"] = {}
+        finally:
+            # Closes the cursor if the caller stops consuming the chunks before the last one
+            chunks.close()
 
-        if sql_query is None:
-            index_list = []
-            # Use the column search_condition_vc if it's Oracle 12c or higher, otherwise use search_condition
-            search_condition_column = "SEARCH_CONDITION_VC" if is_version_12c_or_higher else "SEARCH_CONDITION"
 
-            # Retrieve the unique index and its fields if it exists
-            #                 ORDER BY TO_CHAR({search_condition_column})
-            query = f"""
-                SELECT {search_condition_column} 
-                FROM SYS.ALL_CONSTRAINTS s 
-                WHERE s.TABLE_name = '{table_name}' 
-                AND s.CONSTRAINT_TYPE = 'C'
-            """
-            try:
-                df = pd.read_sql(query, connection)
-                if not df.empty:
-                    index_list = []
-                    for condition in df[search_condition_column.lower()]:
-                        # Use a regular expression to capture the field name inside quotes
-                        match = re.search(r'"([^"]+)"', condition)
-                        if match:
-                            field_name = match.group(1)  # Extract the field name without the quotes
-                            index_list.append(field_name)
-                            
-                    # ordenamos la lista
-                    index_list.sort()
-                    table_dict[table_name]["index"] = index_list
-
-            except SQLAlchemyError as e:
-                print(f"Error retrieving index of {table_name}: {e}")
-                table_dict[table_name]["index"] = []
-
-            fields = ', '.join(f"{fld}" for fld in list(fields_dict.keys()))
-            index = ', '.join(f"{fld}" for fld in index_list)
-            # Construct the basic SQL query to select fields from the specified table
-            query = f"SELECT {fields} FROM {owner}.{table_name}"
-            # Create the ORDER BY clause if there are any indexed fields
-            query2 = f"ORDER BY {index}" 
-            # Create the clause to limit the number of rows returned by the query
-            query3 = f"FETCH FIRST {max_records_per_table} ROWS ONLY"
-            # If a SQL filter is provided, append it to the query
-            if sql_filter is not None:
-                query = query + ' ' + sql_filter
-                print(f'Query with added filter: {query}')
-            # If there are indexed fields, append the ORDER BY clause to the query
-            if len(index_list) > 0:
-                query = query + ' ' + query2
-            # Finally, append the row limit clause to the query
-            if is_version_12c_or_higher:
-                query = query + ' ' + query3 
-            else:
-                query = f"SELECT * FROM ({query}) WHERE ROWNUM <= {max_records_per_table}"
-        else:
-            query = sql_query
-            print(f'Custom query: {query}')
+def _extract_table_with_engine(engine, owner: str, table_name: str, max_records_per_table: int, is_version_12c_or_higher: bool, 
+                               fetch_data: bool = True, prefetched_fields: dict = None):
+    """
+    Retrieves the fields, indexes and data of a table on a connection of its own drawn from the engine pool, so 
+    several tables can be extracted at the same time from different threads.
+
+    See `_extract_table_impl` for the parameters and the returned value.
+    """
+    with engine.connect() as connection:
+        return _extract_table_impl(connection, owner, table_name, None, None, max_records_per_table, is_version_12c_or_higher, 
+                                   fetch_data=fetch_data, prefetched_fields=prefetched_fields)
+
+
+def get_tables_fields(connection, table_names: list):
+    """
+    Retrieves the fields (name, type and length) of several tables at once, with the same filters used by 
+    `get_dbinfo_table` for a single table: columns starting with 'SYS_' or 'AUDIT' are left out.
+
+    The tables are queried in batches of `MAX_IN_LIST_SIZE` names, the maximum size of an IN list in Oracle.
+
+    Parameters:
+    -----------
+    connection : sqlalchemy.engine.base.Connection
+        The open SQLAlchemy connection used to run the queries.
+    table_names : list
+        The names of the tables.
+
+    Returns:
+    --------
+    dict
+        The fields of each table, keyed by table name, in the format of the "fields" key of the table information. 
+        Tables without fields are not included.
+
+    Exceptions:
+    -----------
+    SQLAlchemyError
+        If an error occurs while executing the queries.
+    """
+    query = text(r"""
+        SELECT TABLE_name, COLUMN_name, DATA_TYPE, DATA_LENGTH
+        FROM SYS.ALL_TAB_COLS 
+        WHERE TABLE_name IN :table_names 
+        AND COLUMN_name NOT LIKE 'SYS\_%' ESCAPE '\'
+        AND COLUMN_name NOT LIKE 'AUDIT%'
+        ORDER BY TABLE_name, COLUMN_ID
+    """).bindparams(bindparam('table_names', expanding=True))
+
+    tables_fields = {}
+    for start in range(0, len(table_names), MAX_IN_LIST_SIZE):
+        result = connection.execute(query, {'table_names': table_names[start:start + MAX_IN_LIST_SIZE]})
+        for table_name, column_name, data_type, data_length in result:
+            tables_fields.setdefault(table_name, {})[column_name] = {
+                "data_type": data_type,
+                "data_length": data_length
+            }
+    return tables_fields
+
+
+def get_empty_table_names(connection, owner: str):
+    """
+    Retrieves the names of the tables of an owner that are empty according to the optimizer statistics 
+    (NUM_ROWS = 0 in ALL_TABLES).
+
+    The statistics can be outdated, so a table that has received rows since they were gathered is also returned.
+
+    Parameters:
+    -----------
+    connection : sqlalchemy.engine.base.Connection
+        The open SQLAlchemy connection used to run the query.
+    owner : str
+        The owner of the tables.
+
+    Returns:
+    --------
+    set
+        The names of the empty tables.
+
+    Exceptions:
+    -----------
+    SQLAlchemyError
+        If an error occurs while executing the query.
+    """
+    query = text("SELECT TABLE_name FROM SYS.ALL_TABLES WHERE OWNER = :owner AND NUM_ROWS = 0")
+    df = pd.read_sql(query, connection, params={'owner': owner})
+    return set(df['table_name'].tolist())
+
+
+def get_table_names(connection, owner: str, tables_to_exclude: list, clob_only: bool = False):
+    """
+    Retrieves the names of the tables of an owner whose data can be extracted, excluding views, the tables with 
+    'AUDIT', 'CONFIG' or '_LOG' in their names and the tables of a given list.
+
+    All the exclusions are applied by Oracle in a single query, with MINUS for the views and the AUDIT, CONFIG 
+    and _LOG tables.
+
+    Parameters:
+    -----------
+    connection : sqlalchemy.engine.base.Connection
+        The open SQLAlchemy connection used to run the query.
+    owner : str
+        The owner of the tables.
+    tables_to_exclude : list
+        List of table names to exclude. Empty names are ignored.
+    clob_only : bool, optional
+        If True, only the tables with CLOB fields are returned. Defaults to False.
 
+    Returns:
+    --------
+    list
+        The names of the tables, in alphabetical order.
+
+    Exceptions:
+    -----------
+    SQLAlchemyError
+        If an error occurs while executing the query.
+    """
+    clob_filter = "AND DATA_TYPE = 'CLOB'" if clob_only else ""
+    # The excluded tables are bound as an expanding parameter (:tables_excluded_1, :tables_excluded_2, ...). MINUS 
+    # already returns each table once, so no DISTINCT is needed, and the names are sorted in Python instead of Oracle
+    query = text(f"""
+    SELECT TABLE_name FROM (
+        SELECT TABLE_name 
+        FROM SYS.ALL_TAB_COLS 
+        WHERE OWNER = :owner 
+        {clob_filter}
+        MINUS
+        SELECT OBJECT_name 
+        FROM SYS.ALL_OBJECTS 
+        WHERE OWNER = :owner 
+        AND OBJECT_TYPE = 'VIEW'
+        MINUS
+        SELECT TABLE_name 
+        FROM SYS.ALL_TABLES 
+        WHERE OWNER = :owner 
+        AND (TABLE_name LIKE '%AUDIT%' OR TABLE_name LIKE '%CONFIG%' OR TABLE_name LIKE '%\\_LOG' ESCAPE '\\')
+    )
+    WHERE TABLE_name NOT IN :tables_excluded
+    """).bindparams(bindparam('tables_excluded', expanding=True))
+
+    # Oracle treats empty strings as NULL, and a NULL in a NOT IN list would exclude every table
+    tables_excluded = [table for table in tables_to_exclude if table]
+    df = pd.read_sql(query, connection, params={'owner': owner, 'tables_excluded': tables_excluded})
+    return sorted(df['table_name'].tolist())
+
+
+def iter_dbinfo_tables(connection_info: dict, tables_to_exclude: list, total_records_limit: int = 500000, max_records_per_table: int = 50000, 
+                       skip_empty_tables: bool = False):
+    """
+    Retrieves metadata and data for all tables in an Oracle database, like `get_dbinfo_all_tables`, but yields each 
+    table as soon as it is extracted instead of returning all of them together.
+
+    A caller that writes each table and then drops it only keeps a few tables in memory at a time: the one being 
+    consumed and the ones being extracted in advance (up to twice the number of workers).
+
+    Parameters:
+    -----------
+    The parameters are the same as in `get_dbinfo_all_tables`.
+
+    Yields:
+    -------
+    tuple
+        The name of each table and its metadata and data, in alphabetical order of the tables. The table that 
+        exceeds `total_records_limit` is the last one.
+    """
+
+    host = connection_info['host']
+    port = connection_info['port']
+    service_name = connection_info['service_name']
+    username = connection_info['user']
+    password = connection_info['password']
+    owner = connection_info['owner']
+    print(f'Extracting data from all tables in Oracle database {service_name}...')
+
+    engine = connect_to_oracle(host, port, service_name, username, password)
+
+    if engine is None:
+        return
+
+    # The Oracle version is checked once for all the tables
+    oracle_version = get_oracle_version(engine)
+    if oracle_version is None:
+        print("Error retrieving Oracle version")
+        return
+    is_version_12c_or_higher = oracle_version >= 12
+
+    with engine.connect() as connection:
         try:
-            df = pd.read_sql(query, connection)
-            table_dict[table_name]["data"] = df
+            table_names = get_table_names(connection, owner, tables_to_exclude)
+            empty_tables = get_empty_table_names(connection, owner) if skip_empty_tables else set()
         except SQLAlchemyError as e:
-            print(f"Error retrieving {table_name}: {e}")
-            table_dict[table_name]["data"] = pd.DataFrame()
-    
-    # print_column_types(table_dict)
-    return table_dict
+            print(f"Error retrieving tables: {e}")
+            return
 
+    total_records_retrieved = 0 
 
-def get_dbinfo_all_tables(connection_info: dict, tables_to_exclude: list, total_records_limit: int = 500000, max_records_per_table: int = 50000):
+    # The tables are extracted concurrently, each one on its own pooled session, because most of the time is 
+    # spent waiting for Oracle. The results are yielded in table order, so the limit of records stops at 
+    # the same table as a sequential extraction
+    max_workers = _get_max_workers(connection_info)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        remaining_tables = iter(table_names)
+        pending = deque()
+        while True:
+            # Only a bounded number of tables are extracted in advance, so the finished ones don't pile up in memory 
+            # while the caller is consuming the previous ones
+            while len(pending) < max_workers * 2:
+                table_name = next(remaining_tables, None)
+                if table_name is None:
+                    break
+                future = executor.submit(_extract_table_with_engine, engine, owner, table_name, max_records_per_table, 
+                                         is_version_12c_or_higher, fetch_data=table_name not in empty_tables)
+                pending.append((table_name, future))
+            if not pending:
+                break
+
+            table_name, future = pending.popleft()
+            table_info = future.result()
+            if table_info is None:
+                continue
+
+            total_records_retrieved += len(table_info[table_name]['data'])
+            yield table_name, table_info[table_name]
+
+            if total_records_retrieved > total_records_limit:
+                print(f"Total records limit of {total_records_limit} reached working with {table_name}. Stopping further data retrieval.")
+                break
+    finally:
+        # Tables not started yet are cancelled once the limit is reached (or the caller stops iterating)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def get_dbinfo_all_tables(connection_info: dict, tables_to_exclude: list, total_records_limit: int = 500000, max_records_per_table: int = 50000, 
+                          skip_empty_tables: bool = False):
     """
     Retrieves metadata and data for all tables in an Oracle database, excluding specified tables and views, 
     while respecting limits on the total number of records and the maximum number of records per table.
@@ -586,6 +1312,10 @@ def get_dbinfo_all_tables(connection_info: dict, tables_to_exclude: list, total_
     max_records_per_table : int, optional
         The maximum number of records to retrieve from a single table. This prevents retrieving too much data from any 
         one table. Defaults to 50,000 records per table.
+    skip_empty_tables : bool, optional
+        If True, the data of the tables that are empty according to the optimizer statistics (NUM_ROWS = 0) is not 
+        queried, and they get an empty DataFrame with their columns. It saves a query for each empty table, but a 
+        table whose statistics are outdated loses its rows. Defaults to False.
 
     Returns:
     --------
@@ -601,80 +1331,25 @@ def get_dbinfo_all_tables(connection_info: dict, tables_to_exclude: list, total_
     - If the total number of retrieved records exceeds `total_records_limit`, the function will stop retrieving data 
       and return the tables that have been processed up to that point.
     - Tables without data (empty) will be removed from the returned dictionary.
+    - Up to `max_workers` tables (see `_get_max_workers`) are extracted at the same time, each one on its own 
+      session of the engine pool.
+    - The tables are extracted by `iter_dbinfo_tables`, which can be used instead to process them one at a time.
     """
 
-    host = connection_info['host']
-    port = connection_info['port']
-    service_name = connection_info['service_name']
-    username = connection_info['user']
-    password = connection_info['password']
-    owner = connection_info['owner']
-    print(f'Extracting data from all tables in Oracle database {service_name}...')
-
-    engine = connect_to_oracle(host, port, service_name, username, password)
-
-    if engine is None:
+    if connect_to_oracle(connection_info['host'], connection_info['port'], connection_info['service_name'], 
+                         connection_info['user'], connection_info['password']) is None:
         return None
 
-    all_tables = {}
-    total_records_retrieved = 0 
-
-    with engine.connect() as connection:
-
-        # Query to find tables with 'AUDIT', 'CONFIG' or '_LOG' in the name
-        query = f"""
-        SELECT TABLE_name 
-        FROM SYS.ALL_TABLES 
-        WHERE OWNER = '{owner}' 
-        AND (TABLE_name LIKE '%AUDIT%' OR TABLE_name LIKE '%CONFIG%' OR TABLE_name LIKE '%\_LOG' ESCAPE '\\')
-        """
-        try:
-            df = pd.read_sql(query, connection)
-            tables_to_exclude.extend(df['table_name'].tolist())
-        except SQLAlchemyError as e:
-            print(f"Error retrieving tables: {e}")
-
-        tablas_excluded = ', '.join(f"'{table}'" for table in tables_to_exclude)
-
-        query = f"""
-        select distinct TABLE_name 
-        from SYS.ALL_TAB_COLS 
-        where OWNER = '{owner}'
-        and TABLE_name not in ({tablas_excluded})
-        AND TABLE_name NOT IN (
-            SELECT OBJECT_name 
-            FROM SYS.ALL_OBJECTS 
-            WHERE OWNER = '{owner}' 
-            AND OBJECT_TYPE = 'VIEW'
-        )
-        order by TABLE_name
-        """
-        try:
-            df = pd.read_sql(query, connection)
-            for _, row in df.iterrows():
-                table_name = row['table_name']
-
-                # Call get_dbinfo_table to retrieve table information
-                table_info = get_dbinfo_table(connection_info, table_name, max_records_per_table=max_records_per_table)
-                
-                # Store the table info in the dictionary using table_name as the key
-                if table_info is not None:
-                    all_tables[table_name] = table_info[table_name]
-
-                num_rows = len(table_info[table_name]['data'])
-                total_records_retrieved += num_rows
-                if total_records_retrieved > total_records_limit:
-                    print(f"Total records limit of {total_records_limit} reached working with {table_name}. Stopping further data retrieval.")
-                    break
+    all_tables = dict(iter_dbinfo_tables(connection_info, tables_to_exclude, total_records_limit=total_records_limit, 
+                                         max_records_per_table=max_records_per_table, skip_empty_tables=skip_empty_tables))
+    total_records_retrieved = sum(len(table_info['data']) for table_info in all_tables.values())
 
-        except SQLAlchemyError as e:
-            print(f"Error retrieving tables: {e}")
-        print(f'Total records retrieved: {total_records_retrieved}')
-        # Una vez que se alcanza el límite, eliminar las tablas sin datos del diccionario
-        if total_records_retrieved >= total_records_limit:
-            for table_name in list(all_tables.keys()):
-                if all_tables[table_name]["data"].empty:
-                    del all_tables[table_name]
+    print(f'Total records retrieved: {total_records_retrieved}')
+    # Una vez que se alcanza el límite, eliminar las tablas sin datos del diccionario
+    if total_records_retrieved >= total_records_limit:
+        for table_name in list(all_tables.keys()):
+            if all_tables[table_name]["data"].empty:
+                del all_tables[table_name]
 
     return all_tables
 
@@ -683,7 +1358,8 @@ def get_dbinfo_tables_with_clob(connection_info: dict, tables_to_exclude: list,
     """
     Retrieves information about tables containing CLOB fields, excluding a predefined list of tables. For each table 
     with a CLOB field, the function calls `get_dbinfo_table` to gather detailed metadata and data, with a limit 
-    on the maximum number of records retrieved per table.
+    on the maximum number of records retrieved per table. Up to `max_workers` tables (see `_get_max_workers`) are 
+    retrieved at the same time, each one on its own session of the engine pool.
 
     Parameters:
     -----------
@@ -721,55 +1397,34 @@ def get_dbinfo_tables_with_clob(connection_info: dict, tables_to_exclude: list,
     if engine is None:
         return None
 
+    # The Oracle version is checked once for all the tables
+    oracle_version = get_oracle_version(engine)
+    if oracle_version is None:
+        print("Error retrieving Oracle version")
+        return None
+    is_version_12c_or_higher = oracle_version >= 12
+
     tables_with_clob = {}
 
     with engine.connect() as connection:
-        # Query to find tables with 'AUDIT', 'CONFIG' or '_LOG' in the name
-        query = f"""
-        SELECT TABLE_name 
-        FROM SYS.ALL_TABLES 
-        WHERE OWNER = '{owner}' 
-        AND (TABLE_name LIKE '%AUDIT%' OR TABLE_name LIKE '%CONFIG%' OR TABLE_name LIKE '%\_LOG' ESCAPE '\\')
-        """
         try:
-            df = pd.read_sql(query, connection)
-            tables_to_exclude.extend(df['table_name'].tolist())
-        except SQLAlchemyError as e:
-            print(f"Error retrieving tables: {e}")
-
-        # Create the exclusion list for the query
-        tablas_excluded = ', '.join(f"'{table}'" for table in tables_to_exclude)
-
-        # Query to retrieve tables with CLOB fields that are not in the exclusion list
-        query = f"""
-        select distinct TABLE_name 
-        from SYS.ALL_TAB_COLS 
-        where OWNER = '{owner}'
-        and TABLE_name not in ({tablas_excluded})
-        AND TABLE_name NOT IN (
-            SELECT OBJECT_name 
-            FROM SYS.ALL_OBJECTS 
-            WHERE OWNER = '{owner}' 
-            AND OBJECT_TYPE = 'VIEW'
-        )
-        and DATA_TYPE = 'CLOB'
-        order by TABLE_name
-        """
-        try:
-            df = pd.read_sql(query, connection)
-            # For each table with CLOB fields, call `get_dbinfo_table` to get detailed information
-            for _, row in df.iterrows():
-                table_name = row['table_name']
-
-                # Call get_dbinfo_table to retrieve table information
-                table_info = get_dbinfo_table(connection_info, table_name, max_records_per_table=max_records_per_table)
-                
-                # Store the table info in the dictionary using table_name as the key
-                if table_info is not None:
-                    tables_with_clob[table_name] = table_info[table_name]
-
+            # The fields of all the tables with CLOB fields are retrieved together, instead of once for each table
+            table_names = get_table_names(connection, owner, tables_to_exclude, clob_only=True)
+            tables_fields = get_tables_fields(connection, table_names)
         except SQLAlchemyError as e:
             print(f"Error retrieving tables: {e}")
+            return tables_with_clob
+
+    # The tables are extracted concurrently, each one on its own pooled session, and map returns them in table order
+    with ThreadPoolExecutor(max_workers=_get_max_workers(connection_info)) as executor:
+        results = executor.map(lambda table_name: _extract_table_with_engine(engine, owner, table_name, max_records_per_table, 
+                                                                             is_version_12c_or_higher, 
+                                                                             prefetched_fields=tables_fields.get(table_name, {})), 
+                               table_names)
+        for table_name, table_info in zip(table_names, results):
+            # Store the table info in the dictionary using table_name as the key
+            if table_info is not None:
+                tables_with_clob[table_name] = table_info[table_name]
 
     return tables_with_clob
 
@@ -780,7 +1435,8 @@ def get_dbinfo_list_of_tables(tables: list, connection_info: dict, max_records_p
 
     For each table in the provided list, the function calls `get_dbinfo_table` to gather metadata such as column 
     names, data types, and other table properties, with a limit on the maximum number of records retrieved per table.
-    The results are stored in a dictionary with the table names as keys.
+    The results are stored in a dictionary with the table names as keys. Up to `max_workers` tables (see 
+    `_get_max_workers`) are retrieved at the same time, each one on its own session of the engine pool.
 
     Parameters:
     -----------
@@ -805,14 +1461,24 @@ def get_dbinfo_list_of_tables(tables: list, connection_info: dict, max_records_p
     print(f"Extracting data from a list of tables in Oracle database {connection_info['service_name']}...")
     info_tables = {}
 
-    for table in tables:
-        table_name = table
-        # Call get_dbinfo_table to retrieve table information
-        table_info = get_dbinfo_table(connection_info, table_name, max_records_per_table=max_records_per_table)
-        
-        # Store the table info in the dictionary using table_name as the key
-        if table_info is not None:
-            info_tables[table_name] = table_info[table_name]
+    # The engine and the Oracle version are cached before the threads start, so all of them share the same pool
+    engine = connect_to_oracle(connection_info['host'], connection_info['port'], connection_info['service_name'], 
+                               connection_info['user'], connection_info['password'])
+    if engine is None:
+        return info_tables
+    if get_oracle_version(engine) is None:
+        print("Error retrieving Oracle version")
+        return info_tables
+
+    # The tables are extracted concurrently, each one on its own pooled session, and map returns them in table order
+    with ThreadPoolExecutor(max_workers=_get_max_workers(connection_info)) as executor:
+        results = executor.map(lambda table_name: get_dbinfo_table(connection_info, table_name, 
+                                                                   max_records_per_table=max_records_per_table), 
+                               tables)
+        for table_name, table_info in zip(tables, results):
+            # Store the table info in the dictionary using table_name as the key
+            if table_info is not None:
+                info_tables[table_name] = table_info[table_name]
 
     return info_tables
 
@@ -1,6 +1,7 @@
 from openpyxl import Workbook
+from openpyxl.cell.cell import Cell
 from openpyxl.utils import get_column_letter
-from openpyxl.styles import Font, PatternFill
+from openpyxl.styles import Font, NamedStyle, PatternFill
 
 
 def adjust_column_widths(sheet,  max_width=80):
@@ -20,35 +21,88 @@ def adjust_column_widths(sheet,  max_width=80):
     --------
     None
     """
-    for col in sheet.columns:
-        max_length = 0
-        column = col[0].column_letter  # Get the column name
-
-        # Calculate the width required by the header (considering formatting)
-        header_length = len(str(col[0].value))
-        adjusted_header_length = header_length * 1.5  # Factor to account for bold and larger font size
-
-        # Compare the header length with the lengths of the data values
-        for cell in col:
-            try:
-                cell_length = len(str(cell.value))
-                if cell_length > max_length:
-                    max_length = cell_length
-            except:
-                pass
-        
-        # Use the greater of the header length or data length for column width
-        max_length = max(max_length, adjusted_header_length)
-
-        # Adjust the column width and apply the max_width limit
-        adjusted_width = min(max_length + 2, max_width)
-        sheet.column_dimensions[column].width = adjusted_width
+    # A single pass over the cell values of the rows, instead of one over the cells of each column
+    rows = sheet.iter_rows(values_only=True)
+    for c_idx, width in enumerate(compute_column_widths(rows, max_width=max_width), start=1):
+        sheet.column_dimensions[get_column_letter(c_idx)].width = width
+
+
+def compute_column_widths(rows, max_width=80):
+    """
+    Calculates the width of each column of an Excel sheet based on the maximum width of the data and header values 
+    of its rows.
+
+    Parameters:
+    -----------
+    rows : iterable
+        The rows of the sheet. Each row is a list of values or cells, the first one being the header row.
+
+    max_width : int, optional (default=80)
+        The maximum allowed width for any column. If the calculated width exceeds this value,
+        the column width will be set to this maximum value.
+    
+    Returns:
+    --------
+    list
+        The width of each column, in column order.
+    """
+    max_lengths = []
+    for r_idx, row in enumerate(rows):
+        for c_idx, value in enumerate(row):
+            # Hyperlinks and header cells can be given as cells, so their value is used
+            if isinstance(value, Cell):
+                value = value.value
+            cell_length = len(str(value)) if value is not None else 0
+
+            # Factor to account for bold and larger font size in the header row
+            if r_idx == 0:
+                cell_length = cell_length * 1.5
+
+            if c_idx >= len(max_lengths):
+                max_lengths.append(cell_length)
+            elif cell_length > max_lengths[c_idx]:
+                max_lengths[c_idx] = cell_length
+
+    # Apply the max_width limit
+    return [min(max_length + 2, max_width) for max_length in max_lengths]
+
+
+def adjust_column_widths_from_rows(sheet, rows, max_width=80):
+    """
+    Adjusts the width of each column in a write-only Excel sheet based on the maximum width of the data and header 
+    values that are going to be appended to it.
+
+    Write-only sheets do not keep their cells once they are written and their column widths must be set before the 
+    first row is appended, so the widths are calculated from the row values instead of the sheet cells.
+
+    Parameters:
+    -----------
+    sheet : openpyxl.worksheet._write_only.WriteOnlyWorksheet
+        The worksheet where column widths need to be adjusted.
+
+    rows : list
+        The rows that will be appended to the sheet. Each row is a list of values or cells, the first one being 
+        the header row.
+
+    max_width : int, optional (default=80)
+        The maximum allowed width for any column. If the calculated width exceeds this value,
+        the column width will be set to this maximum value.
+    
+    Returns:
+    --------
+    None
+    """
+    for c_idx, width in enumerate(compute_column_widths(rows, max_width=max_width), start=1):
+        sheet.column_dimensions[get_column_letter(c_idx)].width = width
 
 
 def format_header_cell(cell, font_size=11):
     """
     Formats a header cell with the default styling: white bold text and green background.
 
+    The styling is registered once per workbook and font size as a named style, which is then assigned to every 
+    header cell by name instead of building new font and fill objects for each of them.
+
     Parameters:
     -----------
     cell : openpyxl.cell.cell.Cell
@@ -61,5 +115,34 @@ def format_header_cell(cell, font_size=11):
     --------
     None
     """
-    cell.font = Font(color="FFFFFF", bold=True, size=font_size + 1)
-    cell.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
\ No newline at end of file
+    workbook = cell.parent.parent
+    style_name = f"Header {font_size}"
+    if style_name not in workbook.named_styles:
+        header_style = NamedStyle(name=style_name)
+        header_style.font = Font(color="FFFFFF", bold=True, size=font_size + 1)
+        header_style.fill = PatternFill(start_color="70AD47", end_color="70AD47", fill_type="solid")
+        workbook.add_named_style(header_style)
+    cell.style = style_name
+
+
+def add_header_format(workbook, font_size=11):
+    """
+    Adds to an XlsxWriter workbook the format used for header cells: white bold text and green background.
+
+    It is the XlsxWriter counterpart of `format_header_cell`. The format is created once and shared by every 
+    header cell of the workbook.
+
+    Parameters:
+    -----------
+    workbook : xlsxwriter.Workbook
+        The workbook where the format will be added.
+    
+    font_size : int, optional
+        The font size of the header cells. Default is 11.
+
+    Returns:
+    --------
+    xlsxwriter.format.Format
+        The header cell format.
+    """
+    return workbook.add_format({'font_color': '#FFFFFF', 'bold': True, 'font_size': font_size + 1, 'bg_color': '#70AD47', 'pattern': 1})
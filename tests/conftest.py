@@ -0,0 +1,10 @@
+import importlib.util
+import sys
+import types
+
+# The tests do not connect to a database, so a stub of cx_Oracle is enough to import getdbinfo when the driver 
+# is not installed
+if importlib.util.find_spec("cx_Oracle") is None:
+    cx_Oracle = types.ModuleType("cx_Oracle")
+    cx_Oracle.Error = type("Error", (Exception,), {})
+    sys.modules["cx_Oracle"] = cx_Oracle
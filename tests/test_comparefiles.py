@@ -0,0 +1,69 @@
+import pandas as pd
+from openpyxl import load_workbook
+
+from modules.comparefiles import compare_excel_dbinfo_files, compare_file_info, write_differences_to_excel
+
+
+def write_dbinfo_file(path, tables):
+    """Writes an Excel file with the ALL_TABLES sheet and one sheet of columns per table, as dumped by get_dbinfo_metadata."""
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({'table_name': list(tables)}).to_excel(writer, sheet_name='ALL_TABLES', index=False)
+        for table_name, columns in tables.items():
+            pd.DataFrame(columns, columns=['column_name', 'data_type', 'data_length']).to_excel(writer, sheet_name=table_name, index=False)
+
+
+def test_write_differences_to_excel_writes_formatted_sheet(tmp_path):
+    output_file = tmp_path / 'differences.xlsx'
+    differences_df = pd.DataFrame({'name': ['a', 'b'], 'size': [1.5, float('nan')]})
+    write_differences_to_excel(differences_df, str(output_file))
+
+    sheet = load_workbook(output_file)['Differences']
+    assert [[cell.value for cell in row] for row in sheet.iter_rows()] == [['name', 'size'], ['a', 1.5], ['b', None]]
+    assert sheet['A1'].font.b
+    assert sheet.freeze_panes == 'A2'
+    assert sheet.auto_filter.ref == 'A1:B3'
+
+
+def test_compare_excel_dbinfo_files_finds_column_differences(tmp_path):
+    file1, file2, output_file = tmp_path / 'v1.xlsx', tmp_path / 'v2.xlsx', tmp_path / 'diff.xlsx'
+    write_dbinfo_file(file1, {
+        'SAMPLE': [('ID', 'NUMBER', 22), ('NAME', 'VARCHAR2', 40), ('OLD', 'DATE', 7)],
+        'ONLY_V1': [('ID', 'NUMBER', 22)],
+    })
+    write_dbinfo_file(file2, {
+        'SAMPLE': [('ID', 'NUMBER', 22), ('NAME', 'VARCHAR2', 80), ('NEW', 'CLOB', 4000)],
+        'ONLY_V2': [('ID', 'NUMBER', 22)],
+    })
+
+    differences_df = compare_excel_dbinfo_files(str(file1), str(file2), str(output_file))
+
+    assert sorted(differences_df[['table_name', 'column_name', 'difference']].itertuples(index=False, name=None),
+                  key=str) == sorted([
+        ('SAMPLE', 'NAME', 'data_length mismatch: 40 vs 80'),
+        ('SAMPLE', 'OLD', 'Column missing in second file'),
+        ('SAMPLE', 'NEW', 'Column missing in first file'),
+        ('ONLY_V1', None, 'Table missing in second file'),
+        ('ONLY_V2', None, 'Table missing in first file'),
+    ], key=str)
+    resolution = differences_df.set_index('column_name').loc['NAME', 'resolution_sql']
+    assert resolution == 'ALTER TABLE SGLOWNER.SAMPLE MODIFY NAME VARCHAR2(40);'
+    assert load_workbook(output_file)['Differences'].max_row == len(differences_df) + 1
+
+
+def test_compare_file_info_finds_file_differences(tmp_path):
+    df1 = pd.DataFrame({'file_name': ['same.txt', 'changed.txt', 'only1.txt'],
+                        'modification_date': ['2024-01-01', '2024-01-01', '2024-01-01'],
+                        'file_size': [10, 10, 5]})
+    df2 = pd.DataFrame({'file_name': ['same.txt', 'changed.txt', 'only2.txt'],
+                        'modification_date': ['2024-01-01', '2024-02-01', '2024-01-01'],
+                        'file_size': [10, 20, 7]})
+
+    differences_df = compare_file_info(df1, df2, str(tmp_path / 'out'))
+
+    assert dict(zip(differences_df['file_name'], differences_df['difference_type'])) == {
+        'changed.txt': 'Modification date mismatch, File size mismatch',
+        'only1.txt': 'File only in first folder',
+        'only2.txt': 'File only in second folder',
+    }
+    sheet = load_workbook(tmp_path / 'out' / 'file_differences.xlsx')['Differences']
+    assert sorted(row[0] for row in sheet.iter_rows(min_row=2, values_only=True)) == ['changed.txt', 'only1.txt', 'only2.txt']
@@ -0,0 +1,90 @@
+import zipfile
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from modules.dumpdbinfo import clean_value, dump_dbinfo_to_csv, dump_dbinfo_to_excel
+
+
+def clob_table(ids, texts):
+    """Table dictionary of a table with an ID index field and a TXT CLOB field, as returned by getdbinfo."""
+    return {
+        'T1': {
+            'name': 'T1',
+            'fields': {'ID': {'data_type': 'VARCHAR2', 'data_length': 400},
+                       'TXT': {'data_type': 'CLOB', 'data_length': 4000}},
+            'index': ['ID'],
+            'data': pd.DataFrame({'id': ids, 'txt': texts}),
+        }
+    }
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, ""),
+    ("plain text", "plain text"),
+    ("tab\tnew\nline\r", "tab\tnew\nline\r"),
+    ("a\x00b\x08c\x0bd\x0ce\x1ff", "abcdef"),
+    (12, 12),
+])
+def test_clean_value_removes_illegal_characters(value, expected):
+    assert clean_value(value) == expected
+
+
+def test_dump_dbinfo_to_csv_replaces_newlines_in_text_columns(tmp_path):
+    table_dataframes = clob_table(['1', '2', '3'], ['a\r\nb', 'c\nd', None])
+    dump_dbinfo_to_csv('out', table_dataframes, str(tmp_path), sep='|')
+    assert (tmp_path / 'out' / 'T1.csv').read_text(encoding='utf-8') == 'id|txt\n1|a b\n2|c d\n3|\n'
+
+
+def test_dump_dbinfo_to_csv_keeps_columns_without_newlines(tmp_path):
+    table_dataframes = clob_table(['1', '2'], ['a b', 'c;d'])
+    dump_dbinfo_to_csv('out', table_dataframes, str(tmp_path), sep=';', suffix='_V8')
+    assert (tmp_path / 'out' / 'T1_V8.csv').read_text(encoding='utf-8') == 'id;txt\n1;a b\n2;"c;d"\n'
+
+
+@pytest.mark.parametrize("backend", ['openpyxl', 'xlsxwriter'])
+@pytest.mark.parametrize("threads", [None, 4])
+def test_dump_dbinfo_to_excel_links_clob_files(tmp_path, backend, threads):
+    table_dataframes = clob_table(['1', '2'], ['first\x01text', 'second text'])
+    dump_dbinfo_to_excel('out', table_dataframes, str(tmp_path), backend=backend, threads=threads)
+
+    clob_dir = tmp_path / 'out' / 'CLOB'
+    assert (clob_dir / 'T1__TXT_1.txt').read_bytes() == b'first\x01text'
+    assert (clob_dir / 'T1__TXT_2.txt').read_bytes() == b'second text'
+
+    workbook = load_workbook(tmp_path / 'out' / 'out.xlsx')
+    assert workbook.sheetnames == ['Tables', 'T1']
+    assert workbook['Tables']['A2'].value == 'T1'
+    assert workbook['Tables']['A2'].hyperlink.location == "'T1'!A1"
+
+    sheet = workbook['T1']
+    assert [cell.value for cell in sheet[1]] == ['id', 'txt', 'Return to Tables']
+    clob_cells = [row[1] for row in sheet.iter_rows(min_row=2)]
+    assert [cell.value for cell in clob_cells] == ['T1__TXT_1.txt', 'T1__TXT_2.txt']
+    # XlsxWriter stores the paths of the external links with Windows separators
+    targets = [cell.hyperlink.target.replace('\\', '/') for cell in clob_cells]
+    assert targets == [(clob_dir / name).as_posix() for name in ['T1__TXT_1.txt', 'T1__TXT_2.txt']]
+
+
+@pytest.mark.parametrize("backend", ['openpyxl', 'xlsxwriter'])
+@pytest.mark.parametrize("threads", [None, 4])
+def test_dump_dbinfo_to_excel_raises_clob_write_errors(tmp_path, backend, threads):
+    # The index value of the second row makes its CLOB file name longer than the file system allows
+    table_dataframes = clob_table(['ok', 'x' * 400], ['hello', 'bad'])
+    with pytest.raises(OSError):
+        dump_dbinfo_to_excel('out', table_dataframes, str(tmp_path), backend=backend, threads=threads)
+
+
+def test_dump_dbinfo_to_excel_zip_mode_writes_member_names_without_links(tmp_path):
+    table_dataframes = clob_table(['1', '2'], ['first text', 'second text'])
+    dump_dbinfo_to_excel('out', table_dataframes, str(tmp_path), clob_mode='zip')
+
+    with zipfile.ZipFile(tmp_path / 'out' / 'CLOB.zip') as clob_archive:
+        members = clob_archive.namelist()
+        assert sorted(clob_archive.read(name).decode() for name in members) == ['first text', 'second text']
+
+    sheet = load_workbook(tmp_path / 'out' / 'out.xlsx')['T1']
+    clob_cells = [row[1] for row in sheet.iter_rows(min_row=2)]
+    assert sorted(cell.value for cell in clob_cells) == sorted(members)
+    assert all(cell.hyperlink is None for cell in clob_cells)
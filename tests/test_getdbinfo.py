@@ -0,0 +1,138 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+import modules.getdbinfo as getdbinfo
+from modules.getdbinfo import extract_query_info, iter_sql_bulk, limit_custom_query, read_sql_bulk
+
+
+def limit(sql_query, max_records_per_table=10, is_version_12c_or_higher=True):
+    _, fields_list = extract_query_info(sql_query)
+    return limit_custom_query(sql_query, fields_list, max_records_per_table, is_version_12c_or_higher)
+
+
+def test_limit_custom_query_wraps_simple_query():
+    assert limit("SELECT s.ID, s.NAME FROM SGLOWNER.SAMPLE s") == \
+        "SELECT * FROM (\nSELECT s.ID, s.NAME FROM SGLOWNER.SAMPLE s\n) FETCH FIRST 10 ROWS ONLY"
+
+
+def test_limit_custom_query_uses_rownum_before_12c():
+    assert limit("SELECT ID FROM SAMPLE", is_version_12c_or_higher=False) == \
+        "SELECT * FROM (\nSELECT ID FROM SAMPLE\n) WHERE ROWNUM <= 10"
+
+
+@pytest.mark.parametrize("sql_query", [
+    "SELECT ID FROM SAMPLE;",
+    "SELECT ID FROM SAMPLE ; \n",
+    "SELECT ID FROM SAMPLE; -- all the samples",
+    "SELECT ID FROM SAMPLE;\n-- all the samples\n",
+])
+def test_limit_custom_query_removes_ending_semicolon(sql_query):
+    assert limit(sql_query) == "SELECT * FROM (\nSELECT ID FROM SAMPLE\n) FETCH FIRST 10 ROWS ONLY"
+
+
+def test_limit_custom_query_keeps_ending_comment_out_of_the_parenthesis():
+    query = limit("SELECT ID FROM SAMPLE -- all the samples")
+    assert query == "SELECT * FROM (\nSELECT ID FROM SAMPLE -- all the samples\n) FETCH FIRST 10 ROWS ONLY"
+
+
+def test_limit_custom_query_keeps_semicolon_inside_string():
+    sql_query = "SELECT ID FROM SAMPLE WHERE NAME = 'a;--'"
+    assert limit(sql_query) == f"SELECT * FROM (\n{sql_query}\n) FETCH FIRST 10 ROWS ONLY"
+
+
+@pytest.mark.parametrize("sql_query", [
+    "SELECT t1.ID, t2.ID FROM SAMPLE t1 JOIN TEST t2 ON t1.ID = t2.SAMPLE_ID",
+    "SELECT t1.ID, t2.SAMPLE_ID AS ID FROM SAMPLE t1 JOIN TEST t2 ON t1.ID = t2.SAMPLE_ID",
+    "SELECT * FROM SAMPLE t1 JOIN TEST t2 ON t1.ID = t2.SAMPLE_ID",
+    "SELECT t1.*, t2.NAME FROM SAMPLE t1 JOIN TEST t2 ON t1.ID = t2.SAMPLE_ID",
+])
+def test_limit_custom_query_does_not_wrap_ambiguous_columns(sql_query):
+    assert limit(sql_query + ";") == sql_query
+
+
+def test_limit_custom_query_wraps_columns_with_different_aliases():
+    sql_query = "SELECT t1.ID AS SAMPLE_ID, t2.ID TEST_ID FROM SAMPLE t1 JOIN TEST t2 ON t1.ID = t2.SAMPLE_ID"
+    assert limit(sql_query) == f"SELECT * FROM (\n{sql_query}\n) FETCH FIRST 10 ROWS ONLY"
+
+
+class FakeCursor:
+    """Cursor returning the rows (n, n * 10) for n in range(rows), which records the number of rows fetched."""
+
+    def __init__(self, rows):
+        self.rows = [(n, n * 10) for n in range(rows)]
+        self.fetched = 0
+
+    def execute(self, query, params):
+        self.description = [("ID",), ("VALUE",)]
+
+    def fetchmany(self, size):
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        self.fetched += len(rows)
+        return rows
+
+    def fetchall(self):
+        return self.fetchmany(len(self.rows))
+
+    def close(self):
+        pass
+
+
+def fake_connection(cursor):
+    return SimpleNamespace(connection=SimpleNamespace(cursor=lambda: cursor),
+                           dialect=SimpleNamespace(normalize_name=str.lower))
+
+
+@pytest.mark.parametrize("chunksize", [None, 3, 100])
+def test_read_sql_bulk_stops_after_max_rows(chunksize):
+    cursor = FakeCursor(20)
+    df = read_sql_bulk("SELECT ID, VALUE FROM SAMPLE", fake_connection(cursor), chunksize=chunksize, max_rows=7)
+    assert df["id"].tolist() == list(range(7))
+    assert cursor.fetched == 7
+
+
+def test_iter_sql_bulk_stops_after_max_rows():
+    cursor = FakeCursor(20)
+    chunks = list(iter_sql_bulk("SELECT ID, VALUE FROM SAMPLE", fake_connection(cursor), 3, max_rows=7))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert cursor.fetched == 7
+
+
+def test_iter_sql_bulk_without_max_rows_fetches_all_rows():
+    cursor = FakeCursor(6)
+    chunks = list(iter_sql_bulk("SELECT ID, VALUE FROM SAMPLE", fake_connection(cursor), 3))
+    assert [len(chunk) for chunk in chunks] == [3, 3]
+
+
+class FailingConnection:
+    """Connection whose queries fail, so get_dbinfo_metadata falls back to its empty results."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, query, params):
+        raise SQLAlchemyError("query failed")
+
+
+def test_get_dbinfo_metadata_keeps_views_without_order_column(monkeypatch):
+    engine = SimpleNamespace(connect=FailingConnection)
+    monkeypatch.setattr(getdbinfo, "connect_to_oracle", lambda *args: engine)
+
+    def read_catalog_view(engine, query, params):
+        # ALL_VIEWS has no VIEW_NAME column, as in an Oracle version with different catalog views
+        if "sys.ALL_VIEWS" in query:
+            return pd.DataFrame({"text": ["b", "a"]})
+        return pd.DataFrame({"table_name": [], "object_name": []})
+
+    monkeypatch.setattr(getdbinfo, "_read_sql_bulk_with_engine", read_catalog_view)
+    connection_info = {"host": "host", "port": 1521, "service_name": "service", "user": "user",
+                       "password": "password", "owner": "SGLOWNER"}
+
+    catalog_tables = getdbinfo.get_dbinfo_metadata(connection_info)
+
+    assert catalog_tables["views"]["data"]["text"].tolist() == ["b", "a"]
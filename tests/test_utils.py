@@ -0,0 +1,35 @@
+from openpyxl import Workbook
+from openpyxl.cell.cell import Cell
+
+from modules.utils import adjust_column_widths, compute_column_widths
+
+
+def test_compute_column_widths_uses_longest_value_of_each_column():
+    rows = [['ID', 'NAME'], [1, 'a'], [12345, None], [None, 'abc']]
+    # The header length is weighted by 1.5 and 2 characters are added as margin
+    assert compute_column_widths(rows) == [7, 8]
+
+
+def test_compute_column_widths_caps_the_width():
+    rows = [['ID'], ['x' * 200]]
+    assert compute_column_widths(rows, max_width=50) == [50]
+
+
+def test_compute_column_widths_reads_cell_values():
+    sheet = Workbook().active
+    rows = [[Cell(sheet, value='HEADER')], [Cell(sheet, value='abcdefghijklmn')]]
+    assert compute_column_widths(rows) == [16]
+
+
+def test_compute_column_widths_handles_rows_of_different_length():
+    rows = [['A'], ['abc', 'abcdef']]
+    assert compute_column_widths(rows) == [5, 8]
+
+
+def test_adjust_column_widths_sets_sheet_column_widths():
+    sheet = Workbook().active
+    for row in [['ID', 'DESCRIPTION'], [1, 'short'], [2, 'a longer description']]:
+        sheet.append(row)
+    adjust_column_widths(sheet)
+    assert sheet.column_dimensions['A'].width == 5
+    assert sheet.column_dimensions['B'].width == 22